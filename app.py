@@ -2,15 +2,17 @@
 #   Imports
 # ======================================================================== 
 
-from flask import Flask, render_template, request, jsonify, send_from_directory, make_response
+from flask import Flask, Response, render_template, request, jsonify
 import logging
 import os
 import json
-import importlib
-from recommendations_engine import QUESTIONS, RECOMMENDATIONS
-from processing import build_network
-import pandas as pd
-from bs4 import BeautifulSoup
+import base64
+from catalog import CatalogStore
+from caching import CachedBody, LRUCache, compress_for_request, wait_for_compression
+from metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, CallbackMetric, Counter, HistogramMetric, Registry
+from processing import ROW_COLUMNS, RowTable, build_selection, graph_delta, layout_cache
+from schemas import JSON_MIMETYPE, MSGPACK_MIMETYPE, encode
+from timing import HistogramSet, stage, start_timer, stop_timer
 
 
 # ========================================================================
@@ -36,12 +38,295 @@ app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0
 # Add this too for good measure
 app.config['TEMPLATES_AUTO_RELOAD'] = True    
 
+# Development toggle: LEADERBOARD_DEV_MODE=1 skips the page cache and sends no-store headers
+# so template edits show up on the next refresh. Production mode caches and revalidates with ETags.
+app.config['DEV_MODE'] = os.environ.get('LEADERBOARD_DEV_MODE', '0') == '1'
 
-@app.context_processor
-def utility_processor():
-    def get_version():
-        return str(os.path.getmtime('recommendations_engine.py'))
-    return dict(version=get_version)
+
+# ========================================================================
+#   Load Catalog
+# ======================================================================== 
+
+# Build the catalog once and only rebuild the parts whose catalog_data/ files change.
+# LEADERBOARD_MMAP_CATALOG=1 serves it from a memory-mapped file that all workers share.
+catalog_store = CatalogStore(mapped=os.environ.get('LEADERBOARD_MMAP_CATALOG', '0') == '1')
+catalog_store.start_watcher()
+catalog_store.install_sighup_handler()
+
+
+# Fully built selection results, keyed on (catalog version, tasks, goals)
+selection_cache = LRUCache(maxsize=256, name='selection')
+
+# Rendered index pages as (CachedBody, graph node count, graph edge count), keyed the same way
+page_cache = LRUCache(maxsize=256, name='page')
+
+# Columnar benchmark tables, built on the first /api/rows request for a catalog version
+row_tables = LRUCache(maxsize=2, name='rows')
+
+# Default and maximum page sizes for /api/rows
+ROWS_PAGE_SIZE = 100
+ROWS_MAX_PAGE_SIZE = 1000
+
+# Most node IDs one /api/leaderboards/batch request may ask for
+BATCH_MAX_IDS = 1000
+
+# Encoded /api/leaderboards/batch responses, keyed on (catalog version, mimetype, node IDs, missing IDs)
+batch_cache = LRUCache(maxsize=64, name='batch')
+
+
+# ========================================================================
+#   Request Timing
+# ======================================================================== 
+
+# Per-route, per-stage request durations in seconds; the 'total' stage is the whole request
+request_timings = HistogramSet()
+
+# Requests slower than this (in ms) get their stage breakdown logged at INFO, the rest at DEBUG
+SLOW_REQUEST_MS = float(os.environ.get('LEADERBOARD_SLOW_REQUEST_MS', '100'))
+
+
+@app.before_request
+def start_request_timer():
+    start_timer()
+
+
+def add_server_timing(response, route):
+    """
+    Sends the request's stage durations as a Server-Timing header (shown in the
+    browser devtools' Timing tab) and records them in request_timings.
+    """
+    timer = stop_timer()
+    if timer is None:
+        return
+    total = timer.elapsed()
+
+    for name, seconds in timer.stages:
+        request_timings.get(route, name).observe(seconds)
+    request_timings.get(route, 'total').observe(total)
+
+    server_timing = timer.server_timing(total)
+    response.headers['Server-Timing'] = server_timing
+    level = logging.INFO if total * 1e3 >= SLOW_REQUEST_MS else logging.DEBUG
+    if logging.root.isEnabledFor(level):
+        logging.log(level, f"{request.method} {request.path} {response.status_code} - {server_timing}")
+
+
+@app.teardown_request
+def clear_request_timer(exception):
+    # after_request is skipped when a request fails, so make sure the timer is dropped
+    stop_timer()
+
+
+# ========================================================================
+#   Metrics
+# ======================================================================== 
+
+def all_caches():
+    """Every LRUCache in this process, including a mapped catalog's decoded caches."""
+    return [selection_cache, page_cache, row_tables, batch_cache, *getattr(catalog_store.current, 'decoded_caches', ())]
+
+
+def cache_counters():
+    # Per-cache counters for /metrics; the layout cache counts node positions, so it has no entries or evictions
+    stats = [cache.stats() for cache in all_caches()]
+    stats.append({'name': 'layout', 'hits': layout_cache.hits, 'misses': layout_cache.misses})
+    return stats
+
+
+# Graph sizes run from a single task's subtree to the whole catalog
+GRAPH_SIZE_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+RESPONSE_BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+metrics = Registry()
+request_count = metrics.register(Counter(
+    'leaderboard_requests_total', 'Requests served, by URL rule, method and status.', ('route', 'method', 'status')
+))
+metrics.register(HistogramMetric(
+    'leaderboard_request_stage_duration_seconds',
+    'Request stage durations by URL rule; stage="total" is the whole request.',
+    ('route', 'stage'), histograms=request_timings
+))
+response_bytes = metrics.register(HistogramMetric(
+    'leaderboard_response_bytes', 'Response body sizes by URL rule, after compression.',
+    ('route',), RESPONSE_BYTES_BUCKETS
+))
+graph_nodes = metrics.register(HistogramMetric(
+    'leaderboard_graph_nodes', 'Nodes per graph response (added nodes for deltas).', ('route',), GRAPH_SIZE_BUCKETS
+))
+graph_edges = metrics.register(HistogramMetric(
+    'leaderboard_graph_edges', 'Edges per graph response (added edges for deltas).', ('route',), GRAPH_SIZE_BUCKETS
+))
+for counter in ('hits', 'misses', 'evictions'):
+    metrics.register(CallbackMetric(
+        f'leaderboard_cache_{counter}_total', f'Cache {counter} by cache.', 'counter', ('cache',),
+        lambda counter=counter: [((stats['name'],), stats[counter]) for stats in cache_counters() if counter in stats]
+    ))
+metrics.register(CallbackMetric(
+    'leaderboard_cache_entries', 'Entries held by each cache.', 'gauge', ('cache',),
+    lambda: [((stats['name'],), stats['size']) for stats in cache_counters() if 'size' in stats]
+))
+metrics.register(CallbackMetric(
+    'leaderboard_catalog_info', 'The catalog version being served.', 'gauge', ('version',),
+    lambda: [((catalog_store.current.version,), 1)]
+))
+metrics.register(CallbackMetric(
+    'leaderboard_catalog_reloads_total', 'Catalog snapshots published since startup.', 'counter', (),
+    lambda: [((), catalog_store.reload_count)]
+))
+metrics.register(CallbackMetric(
+    'leaderboard_catalog_nodes', 'Graph nodes in the whole catalog.', 'gauge', (),
+    lambda: [((), len(catalog_store.current.node_table))]
+))
+
+
+def request_route():
+    # Label by URL rule rather than path, so /api/leaderboards/<id> is one route
+    rule = request.url_rule
+    return rule.rule if rule is not None else 'unmatched'
+
+
+def observe_graph(nodes, edges):
+    """Records the size of the graph a response carries."""
+    route = request_route()
+    graph_nodes.observe(nodes, route)
+    graph_edges.observe(edges, route)
+
+
+def record_response_metrics(response, route):
+    request_count.inc(route, request.method, str(response.status_code))
+    content_length = response.content_length
+    if content_length is not None:
+        response_bytes.observe(content_length, route)
+
+
+@app.after_request
+def finish_request(response):
+    # One hook for both, so the route is only looked up once per request
+    route = request_route()
+    add_server_timing(response, route)
+    record_response_metrics(response, route)
+    return response
+
+
+# ========================================================================
+#   Page Rendering
+# ======================================================================== 
+
+def get_selection(catalog, cache_key):
+    """Returns the (cached) SelectionResult for a (version, tasks, goals) key."""
+    version, tasks, goals = cache_key
+    return selection_cache.get_or_build(cache_key, lambda: build_selection(catalog, tasks, goals))
+
+
+def selection_cache_key(catalog, args):
+    """Builds the canonical (version, tasks, goals) cache key from ?tasks=...&goals=... args."""
+    with stage('canonicalize'):
+        return (catalog.version,) + catalog.selection.canonicalize(args.getlist('tasks'), args.getlist('goals'))
+
+
+def make_selection_token(cache_key):
+    """Encodes a (version, tasks, goals) key as an opaque, URL-safe token."""
+    return base64.urlsafe_b64encode(json.dumps(cache_key, separators=(',', ':')).encode('utf-8')).decode('ascii')
+
+
+def parse_selection_token(token):
+    """Decodes a selection token back into a (version, tasks, goals) key, or None if it's malformed."""
+    try:
+        version, tasks, goals = json.loads(base64.urlsafe_b64decode(token.encode('ascii')))
+    except (ValueError, TypeError):
+        return None
+    # Tokens come from the client, so check the shape before anything hashes or looks them up
+    if not isinstance(version, str) or not all(
+        isinstance(names, list) and all(isinstance(name, str) for name in names) for names in (tasks, goals)
+    ):
+        return None
+    return version, tuple(tasks), tuple(goals)
+
+
+def make_rows_cursor(version, offset):
+    """Encodes a position in /api/rows results as an opaque cursor."""
+    return base64.urlsafe_b64encode(json.dumps([version, offset]).encode('utf-8')).decode('ascii')
+
+
+def parse_rows_cursor(token):
+    """Decodes a /api/rows cursor into (version, offset), or None if it's malformed."""
+    try:
+        version, offset = json.loads(base64.urlsafe_b64decode(token.encode('ascii')))
+        return version, int(offset)
+    except (ValueError, TypeError):
+        return None
+
+
+def render_index_page(catalog, cache_key):
+    """
+    Renders the index page for a (version, tasks, goals) key.
+
+    Returns:
+        tuple: (CachedBody, node count, edge count); the counts describe the
+            embedded graph, so cached pages can be measured without the selection.
+    """
+    result = get_selection(catalog, cache_key)
+
+    # Render the template, passing in the most recent graph data
+    # (the benchmark table and leaderboard details aren't part of the page; they're fetched on demand)
+    with stage('render'):
+        html = render_template(
+            'index.html',
+            network_data=result.network_json,
+            selection_token=make_selection_token(cache_key),
+            # The graph's integer IDs belong to this snapshot, not whatever is current by now
+            version=catalog.version
+        )
+    network_data = result.network_data
+    return CachedBody(html.encode('utf-8'), 'text/html'), len(network_data.nodes), len(network_data.edges)
+
+
+def send_cached(cached, cache_control):
+    """
+    Serves a CachedBody with its ETag and the given Cache-Control header, using
+    its precompressed gzip/brotli variant when the client accepts one.
+    Requests whose If-None-Match matches get an empty 304 instead.
+    """
+    with stage('send'):
+        encoding, body, etag = cached.select(request.accept_encodings)
+        response = Response(body, mimetype=cached.mimetype)
+        if encoding is not None:
+            response.content_encoding = encoding
+        if cached.compressible:
+            response.vary.add('Accept-Encoding')
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = cache_control
+        return response.make_conditional(request)
+
+
+def preferred_mimetype():
+    """
+    Picks the response format from the Accept header: MessagePack for clients that
+    ask for application/msgpack (or application/x-msgpack), JSON for everyone else.
+    """
+    best = request.accept_mimetypes.best_match([JSON_MIMETYPE, MSGPACK_MIMETYPE, 'application/x-msgpack'])
+    return MSGPACK_MIMETYPE if best in (MSGPACK_MIMETYPE, 'application/x-msgpack') else JSON_MIMETYPE
+
+
+def integer_id_error(catalog, node_ref, version):
+    """
+    Integer node IDs are only meaningful for the catalog version that issued them,
+    so they have to come with that version; guessing would silently resolve them
+    against whatever catalog is current.
+
+    Returns:
+        tuple: (error payload, status) if node_ref is an integer ID sent without
+            a version (400) or with an outdated one (409), otherwise None.
+    """
+    is_integer = (isinstance(node_ref, int) and not isinstance(node_ref, bool)) or \
+        (isinstance(node_ref, str) and node_ref.isdigit())
+    if not is_integer:
+        return None
+    if version is None:
+        return {"error": "Integer node IDs must be sent with the catalog version they came from"}, 400
+    if version != catalog.version:
+        return {"error": "Catalog version changed; reload the graph"}, 409
+    return None
 
 
 # ========================================================================
@@ -51,169 +336,395 @@ def utility_processor():
 @app.route('/')
 def index():
     try:
-        # Force reload the recommendations module
-        import recommendations_engine
-        importlib.reload(recommendations_engine)
-        
-        # Add this right after reloading
-        with open('recommendations_engine.py', 'r') as f:
-            content = f.read()
+        # Grab one snapshot so the whole request sees a consistent catalog
+        catalog = catalog_store.current
         
-        # Process QUESTIONS and RECOMMENDATIONS data into a "processed_data" format
-        # Get query parameters for filtering tasks and goals
-        tasks_selected = request.args.getlist('tasks')   # Retrieves tasks from query params like ?tasks=chat&tasks=generate_text
-        goals_selected = request.args.getlist('goals')   # Retrieves goals from query params like ?goals=quality&goals=speed
+        # Get query parameters for filtering tasks and goals, e.g. ?tasks=Chat&tasks=Generate text&goals=Speed
+        # Canonicalize the selection so the same combination always hits the same cache entry
+        cache_key = selection_cache_key(catalog, request.args)
 
-        all_tasks = list(RECOMMENDATIONS.keys())
-        
-        # If tasks and goals are specified, filter RECOMMENDATIONS
-        if tasks_selected and goals_selected:              
-            filtered_recs = {}
-            for task, goals in RECOMMENDATIONS.items():
-                if task not in tasks_selected:
-                    continue
-                filtered_goals = {}
-                for goal, leaderboards in goals.items():
-                    if goal not in goals_selected:
-                        continue
-                    filtered_goals[goal] = leaderboards
-                if filtered_goals:
-                    filtered_recs[task] = filtered_goals       
-                    
-        # If only tasks are selected, filter only by tasks
-        elif tasks_selected:
-            filtered_recs = {task: goals for task, goals in RECOMMENDATIONS.items() if task in tasks_selected}
-            # ADD LOGGING: Show filtered_recs for tasks only
-            
-        # If only goals are selected, filter only by goals
-        elif goals_selected:
-            filtered_recs = {}
-            for task, goals in RECOMMENDATIONS.items():
-                filtered_goals = {goal: leaderboards for goal, leaderboards in goals.items() if goal in goals_selected}
-                if filtered_goals:
-                    filtered_recs[task] = filtered_goals
+        if app.config['DEV_MODE']:
+            page, nodes, edges = render_index_page(catalog, cache_key)
+            observe_graph(nodes, edges)
+            response = Response(page.body, mimetype=page.mimetype)
+
+            # Add cache-control headers to prevent browser caching
+            # 'no-cache': browser must revalidate with server before using cached version
+            # 'no-store': browser shouldn't store the response at all
+            # 'must-revalidate': browser must check if the content has changed
+            response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
             
-        else:
-            filtered_recs = RECOMMENDATIONS
+            # 'Pragma: no-cache' for backwards compatibility with HTTP/1.0
+            response.headers['Pragma'] = 'no-cache'
             
-        processed_data = []
-        for task, goals in filtered_recs.items():
-            for goal, leaderboards in goals.items():
-                for leaderboard_info in leaderboards:
-                    for benchmark in leaderboard_info.get('benchmarks', []):
-                        row = {
-                            'Task': task,
-                            'Goal': goal,
-                            'Leaderboard': leaderboard_info['leaderboard'],
-                            'Tips': "\n".join(leaderboard_info.get('analysis_tips', [])),
-                            'Source': leaderboard_info['leaderboard_link']['url'],
-                            'Tooltip': leaderboard_info.get('tooltip', ''),
-                            'Methodology': leaderboard_info.get('methodology', {}).get('url', '')
-                        }
-                        processed_data.append(row)
-
-        # Build the PyVis network
-        net = build_network(filtered_recs)
-        
-        # If net is None or empty, that might indicate an empty filtered_recs
-        if net is None:
-            logging.warning("Network returned by build_network is None. filtered_recs might be empty.")
-        
-        #  Get network data for vis.js
-        network_data = {
-            'nodes': net.nodes,
-            'edges': net.edges
-        }
+            # Set expiration to 0 to help prevent caching in older browsers
+            response.headers['Expires'] = '0'
+            return response
 
-        # Render the template, passing in the most recent graph HTML and processed_data
-        response = render_template(
-            'index.html',
-            network_data=json.dumps(network_data),
-            initial_data=json.dumps(processed_data),
-            recommendations_data=RECOMMENDATIONS
-        )
-        
-        # Create a response object that I can modify with headers
-        # Add cache-control headers to prevent browser caching
-        # 'no-cache': browser must revalidate with server before using cached version
-        # 'no-store': browser shouldn't store the response at all
-        # 'must-revalidate': browser must check if the content has changed
-        response = make_response(response)
-        response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
-        
-        # 'Pragma: no-cache' for backwards compatibility with HTTP/1.0
-        response.headers['Pragma'] = 'no-cache'
-        
-        # Set expiration to 0 to help prevent caching in older browsers
-        response.headers['Expires'] = '0'
-        
-        # Return the modified response with no-cache headers
-        return response
+        # Production: serve the cached page and let the browser revalidate it by ETag
+        page, nodes, edges = page_cache.get_or_build(cache_key, lambda: render_index_page(catalog, cache_key))
+        observe_graph(nodes, edges)
+        return send_cached(page, 'no-cache')
 
-        
-       
     except Exception as e:
         logging.error(f"Error in index route: {str(e)}")
         return render_template(
             'index.html',
             error=str(e),
-            graph_body='',   # If we have an error, just pass an empty graph_body
-            initial_data='[]'
+            graph_body='',  # If we have an error, just pass an empty graph_body
+            version=catalog_store.current.version
         )
 
+@app.route('/api/graph')
+def graph():
+    """Returns just the vis.js nodes and edges for ?tasks=...&goals=..., so the page can update in place."""
+    try:
+        catalog = catalog_store.current
+        cache_key = selection_cache_key(catalog, request.args)
+        result = get_selection(catalog, cache_key)
+        observe_graph(len(result.network_data.nodes), len(result.network_data.edges))
+
+        cached = result.graph_msgpack if preferred_mimetype() == MSGPACK_MIMETYPE else result.graph
+        response = send_cached(cached, 'no-cache')
+        response.vary.add('Accept')
+        response.headers['X-Catalog-Version'] = catalog.version
+        response.headers['X-Selection-Token'] = make_selection_token(cache_key)
+        return response
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        logging.error(f"Error in graph route: {str(e)}")
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/api/graph/delta')
+def graph_delta_route():
+    """
+    Returns only the node and edge additions/removals between two selections.
+
+    The previous selection is given either as a token from an earlier response
+    (?from=...) or as ?from_tasks=...&from_goals=...; the new one as ?tasks=...&goals=....
+    If the token is from an older catalog version there's nothing to diff against,
+    so the full graph comes back with "full": true.
+    """
+    try:
+        catalog = catalog_store.current
+        cache_key = selection_cache_key(catalog, request.args)
+        result = get_selection(catalog, cache_key)
+
+        if 'from' in request.args:
+            previous_key = parse_selection_token(request.args['from'])
+            if previous_key is None:
+                return jsonify({"error": "Invalid selection token"}), 400
+        else:
+            previous_key = (catalog.version,) + catalog.selection.canonicalize(
+                request.args.getlist('from_tasks'), request.args.getlist('from_goals')
+            )
+
+        payload = {
+            'version': catalog.version,
+            'token': make_selection_token(cache_key),
+        }
+        if previous_key[0] != catalog.version:
+            payload['full'] = True
+            payload['nodes'] = result.network_data.nodes
+            payload['edges'] = result.network_data.edges
+        else:
+            # Tokens come from the client, so validate them like any other selection
+            previous_key = (catalog.version,) + catalog.selection.canonicalize(*previous_key[1:])
+            payload['full'] = False
+            previous = get_selection(catalog, previous_key)
+            with stage('delta'):
+                payload.update(graph_delta(previous, result))
+
+        if payload['full']:
+            observe_graph(len(payload['nodes']), len(payload['edges']))
+        else:
+            observe_graph(len(payload['nodes_added']), len(payload['edges_added']))
+
+        mimetype = preferred_mimetype()
+        with stage('encode'):
+            response = Response(encode(payload, mimetype), mimetype=mimetype)
+        response.vary.add('Accept')
+        return response
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        logging.error(f"Error in graph_delta route: {str(e)}")
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/api/rows')
+def rows():
+    """
+    Serves the benchmark table (one row per benchmark) in columnar pages.
+
+    Query parameters:
+        tasks, goals: Same selection filters as the page.
+        q: Case-insensitive search across the Leaderboard and Tips columns.
+        sort: Column to sort by; prefix with '-' for descending.
+        limit: Page size (default 100, max 1000).
+        cursor: next_cursor from the previous page. Repeat the other parameters with it.
+    """
+    try:
+        catalog = catalog_store.current
+        table = row_tables.get_or_build(catalog.version, lambda: RowTable(catalog))
+
+        sort = request.args.get('sort') or None
+        descending = bool(sort) and sort.startswith('-')
+        if sort:
+            sort = sort.lstrip('-')
+            if sort not in ROW_COLUMNS:
+                return jsonify({"error": f"Unknown sort column: {sort}"}), 400
+
+        limit = min(max(int(request.args.get('limit', ROWS_PAGE_SIZE)), 1), ROWS_MAX_PAGE_SIZE)
+
+        offset = 0
+        if request.args.get('cursor'):
+            cursor = parse_rows_cursor(request.args['cursor'])
+            if cursor is None:
+                return jsonify({"error": "Invalid cursor"}), 400
+            if cursor[0] != catalog.version:
+                return jsonify({"error": "Catalog version changed; start again without a cursor"}), 409
+            offset = max(cursor[1], 0)
+
+        tasks, goals = catalog.selection.canonicalize(request.args.getlist('tasks'), request.args.getlist('goals'))
+        with stage('query'):
+            matches = table.query(catalog.selection.mask(tasks, goals), request.args.get('q'), sort, descending)
+        page = matches[offset:offset + limit]
+
+        with stage('encode'):
+            payload = table.encode_page(page)
+            payload.update({
+                'version': catalog.version,
+                'total': len(matches),
+                'next_cursor': make_rows_cursor(catalog.version, offset + limit) if offset + limit < len(matches) else None,
+            })
+            return jsonify(payload)
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        logging.error(f"Error in rows route: {str(e)}")
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/api/leaderboards/<path:node_id>')
+def leaderboard_detail(node_id):
+    try:
+        catalog = catalog_store.current
+
+        error = integer_id_error(catalog, node_id, request.args.get('v'))
+        if error is not None:
+            return jsonify(error[0]), error[1]
+
+        # node_id is either an integer ID from the graph or a canonical string ID
+        with stage('lookup'):
+            detail = catalog.leaderboard_detail(node_id)
+        if detail is None:
+            return jsonify({"error": "Leaderboard not found"}), 404
+
+        # URLs carrying the current version (?v=...) never change, so they can be cached for good.
+        # Anything else has to revalidate, since the catalog may have moved on.
+        if request.args.get('v') == catalog.version:
+            cache_control = 'public, max-age=31536000, immutable'
+        else:
+            cache_control = 'no-cache'
+        cached = detail.cached_msgpack if preferred_mimetype() == MSGPACK_MIMETYPE else detail.cached
+        response = send_cached(cached, cache_control)
+        response.vary.add('Accept')
+        return response
+
+    except Exception as e:
+        logging.error(f"Error in leaderboard_detail route: {str(e)}")
+        return jsonify({"error": str(e)}), 500
+
+def encode_batch(catalog, found, missing, mimetype):
+    """
+    Encodes a batch of leaderboard details. Many nodes share a detail, so each
+    distinct payload is sent once and node IDs map to its index in "details".
+    """
+    numbers = {}
+    details = []
+    leaderboards = {}
+    for key, detail in found:
+        number = numbers.get(detail.cached.etag)
+        if number is None:
+            number = numbers[detail.cached.etag] = len(details)
+            details.append(detail)
+        leaderboards[key] = number
+
+    if mimetype == MSGPACK_MIMETYPE:
+        return encode({
+            'version': catalog.version,
+            'details': [detail.payload for detail in details],
+            'leaderboards': leaderboards,
+            'missing': missing,
+        }, MSGPACK_MIMETYPE)
+
+    # Splice the precomputed JSON bodies together instead of re-encoding every payload
+    return b''.join([
+        b'{"version":', encode(catalog.version),
+        b',"details":[', b','.join(detail.cached.body for detail in details),
+        b'],"leaderboards":', encode(leaderboards),
+        b',"missing":', encode(missing), b'}'
+    ])
+
+
+@app.route('/api/leaderboards/batch', methods=['POST'])
+def leaderboard_details_batch():
+    """
+    Returns the detail payloads for a list of leaderboard node IDs (integer or
+    string) in one response:
+    {"version": ..., "details": [payload, ...], "leaderboards": {node_id: index into details, ...},
+     "missing": [...]}
+    """
+    try:
+        catalog = catalog_store.current
+
+        body = request.get_json(silent=True)
+        node_ids = body.get('ids') if isinstance(body, dict) else None
+        if not isinstance(node_ids, list):
+            return jsonify({"error": "Expected a JSON body like {\"ids\": [...]}"}), 400
+        if len(node_ids) > BATCH_MAX_IDS:
+            return jsonify({"error": f"At most {BATCH_MAX_IDS} ids per request"}), 400
+
+        for node_id in node_ids:
+            error = integer_id_error(catalog, node_id, body.get('version'))
+            if error is not None:
+                return jsonify(error[0]), error[1]
+
+        found = []
+        missing = []
+        seen = set()
+        with stage('lookup'):
+            for node_id in node_ids:
+                if isinstance(node_id, bool) or not isinstance(node_id, (int, str)):
+                    missing.append(node_id)
+                    continue
+                key = str(node_id)
+                if key in seen:
+                    continue
+                seen.add(key)
+
+                detail = catalog.leaderboard_detail(node_id)
+                if detail is None:
+                    missing.append(node_id)
+                else:
+                    found.append((key, detail))
+
+        # A page asks for the same node set on every view, so whole responses are cached
+        mimetype = preferred_mimetype()
+        cache_key = (catalog.version, mimetype, tuple(key for key, detail in found), encode(missing))
+        cached = batch_cache.get(cache_key)
+        if cached is None:
+            with stage('encode'):
+                cached = CachedBody(encode_batch(catalog, found, missing, mimetype), mimetype)
+            batch_cache.put(cache_key, cached)
+
+        with stage('send'):
+            encoding, response_body, _ = cached.select(request.accept_encodings)
+            if encoding is None and cached.compressible:
+                # The stored variants are still being built, so compress this one quickly
+                encoding, response_body = compress_for_request(cached.body, request.accept_encodings)
+            response = Response(response_body, mimetype=mimetype)
+            if encoding is not None:
+                response.content_encoding = encoding
+            if cached.compressible:
+                response.vary.add('Accept-Encoding')
+        response.vary.add('Accept')
+        return response
+
+    except Exception as e:
+        logging.error(f"Error in leaderboard_details_batch route: {str(e)}")
+        return jsonify({"error": str(e)}), 500
+
+# Kept for older pages still posting to it; serves the same cached payloads as /api/leaderboards
 @app.route('/filter_data', methods=['POST'])
 def filter_data():
     try:
-        # Force reload recommendations module
-        import recommendations_engine
-        importlib.reload(recommendations_engine)
-        global RECOMMENDATIONS
-        RECOMMENDATIONS = recommendations_engine.RECOMMENDATIONS
+        # Grab one snapshot so the whole request sees a consistent catalog
+        catalog = catalog_store.current
 
         node_id = request.json.get('node_id')
         if not node_id:
             return jsonify({"error": "No node ID provided"}), 400
 
-        if node_id.startswith('leaderboard_'):
-            # Example: nodeId is "leaderboard_Generate text_Speed_KLU"
-            parts = node_id.split('_', 3)  
-            if len(parts) < 4:
-                return jsonify({"error": "Invalid leaderboard node ID format"}), 400
+        error = integer_id_error(catalog, node_id, request.json.get('version'))
+        if error is not None:
+            return jsonify(error[0]), error[1]
 
-            task = parts[1]
-            goal = parts[2]
-            lb_name = parts[3]
-            
-            # Only look in the specific task and goal section
-            if task in RECOMMENDATIONS and goal in RECOMMENDATIONS[task]:
-                leaderboards = RECOMMENDATIONS[task][goal]
-                
-                # Look for our leaderboard only in this section
-                for lb in leaderboards:
-                    if lb['leaderboard'] == lb_name:
-                        bench_obj = {}
-                        if 'benchmarks' in lb:
-                            for bench in lb['benchmarks']:
-                                name = bench.get('benchmark_name', 'Untitled Benchmark')
-                                bench_obj[name] = {
-                                    'measures': bench.get('benchmark_measures', ''),
-                                    'score_interpretation': bench.get('score_interpretation', '')
-                                }
-                        
-                        return jsonify({
-                            'leaderboard': lb['leaderboard'],
-                            'tooltip': lb.get('tooltip', ''),
-                            'analysis_tips': lb.get('analysis_tips', []),
-                            'benchmarks': bench_obj,
-                            'leaderboard_link': lb['leaderboard_link']['url'],
-                            'methodology_url': lb.get('methodology', {}).get('url', ''),
-                        })
-
-        return jsonify({"error": "Leaderboard not found"}), 404
+        # Example: nodeId is 17 or "leaderboard_Generate text_Speed_KLU"
+        # Details are prebuilt per node ID when the catalog loads, so this is a single dict hit
+        with stage('lookup'):
+            detail = catalog.leaderboard_detail(node_id)
+        if detail is None:
+            return jsonify({"error": "Leaderboard not found"}), 404
+
+        return send_cached(detail.cached, 'no-cache')
     
     except Exception as e:
         logging.error(f"Error in filter_data route: {str(e)}")
         return jsonify({"error": str(e)}), 500
 
+@app.route('/api/cache_stats')
+def cache_stats():
+    return jsonify([cache.stats() for cache in all_caches()])
+
+@app.route('/metrics')
+def metrics_route():
+    """Prometheus metrics for this process, in the text exposition format."""
+    return Response(metrics.render(), content_type=METRICS_CONTENT_TYPE)
+
+@app.route('/api/timing_stats')
+def timing_stats():
+    """Per-route, per-stage request counts, mean and approximate p50/p95 durations (ms, to the bucket bound)."""
+    def ms(seconds):
+        return None if seconds is None else round(seconds * 1e3, 3)
+
+    return jsonify([
+        {
+            'route': route,
+            'stage': name,
+            'count': histogram.count,
+            'mean_ms': ms(histogram.sum / histogram.count) if histogram.count else None,
+            'p50_ms': ms(histogram.quantile(0.5)),
+            'p95_ms': ms(histogram.quantile(0.95)),
+        }
+        for (route, name), histogram in request_timings.items()
+    ])
+
+
+# ========================================================================
+#   App Factory (Pre-Fork Servers)
+# ========================================================================
+
+def warm_caches():
+    """
+    Builds what the first requests would otherwise build: the default view's
+    selection, graph and page, and the benchmark table. Then waits for the
+    background compressor, so every cached body has its gzip/brotli variants.
+    """
+    catalog = catalog_store.current
+    cache_key = (catalog.version, (), ())
+    get_selection(catalog, cache_key)
+    if not app.config['DEV_MODE']:
+        with app.test_request_context('/'):
+            page_cache.get_or_build(cache_key, lambda: render_index_page(catalog, cache_key))
+    row_tables.get_or_build(catalog.version, lambda: RowTable(catalog))
+    wait_for_compression()
+
+
+def create_app():
+    """
+    App factory for pre-fork servers (see gunicorn.conf.py).
+
+    Loaded once in the master process before workers are forked, so the catalog,
+    its indexes and the warmed caches are built once and shared copy-on-write by
+    every worker instead of each worker building its own.
+    """
+    warm_caches()
+    return app
+
+
 if __name__ == '__main__':
     app.run(debug=True)
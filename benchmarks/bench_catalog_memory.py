@@ -0,0 +1,98 @@
+# ========================================================================
+#   Benchmark: Catalog Memory
+# ========================================================================
+#
+# Reports how much the pooled Leaderboard records save on the current
+# catalog: the deep size of RECOMMENDATIONS as loaded (every pasted leaderboard
+# block its own dicts, lists and strings) against the pooled records, the size
+# of one leaderboard as nested dicts against one record, the time to walk every
+# leaderboard's fields both ways, and the detail bodies stored per node against
+# the distinct bodies actually kept.
+#
+# Usage: python benchmarks/bench_catalog_memory.py
+
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import msgspec
+
+from catalog import load_leaderboard_records
+
+
+def deep_size(obj, seen=None, strings=True):
+    # Counts every reachable object once, so shared values are only paid for once
+    seen = set() if seen is None else seen
+    if id(obj) in seen or (not strings and isinstance(obj, str)):
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, msgspec.Struct):
+        size += sum(deep_size(getattr(obj, name), seen, strings) for name in obj.__struct_fields__)
+    elif isinstance(obj, dict):
+        size += sum(deep_size(k, seen, strings) + deep_size(v, seen, strings) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(deep_size(item, seen, strings) for item in obj)
+    return size
+
+
+def walk_dicts(recommendations):
+    # The .get() chains the app used on the raw dicts
+    for goals in recommendations.values():
+        for leaderboards in goals.values():
+            for lb in leaderboards:
+                lb['leaderboard'], lb.get('tooltip', ''), lb['leaderboard_link']['url']
+                lb.get('methodology', {}).get('url', ''), lb.get('analysis_tips', [])
+                for bench in lb.get('benchmarks', []):
+                    bench.get('benchmark_name', 'Unknown Benchmark'), bench.get('benchmark_measures', '')
+
+
+def walk_records(recommendations):
+    for goals in recommendations.values():
+        for leaderboards in goals.values():
+            for lb in leaderboards:
+                lb.name, lb.tooltip, lb.link.url, lb.methodology.url, lb.analysis_tips
+                for bench in lb.benchmarks:
+                    bench.name, bench.measures
+
+
+def main():
+    from catalog import load_catalog
+
+    # The plain dicts, as json.load() builds them from the task files
+    from recommendations_engine import RECOMMENDATIONS as raw
+
+    normalized = load_leaderboard_records(raw)
+    raw_size = deep_size(raw)
+    normalized_size = deep_size(normalized)
+    occurrences = sum(len(lbs) for goals in raw.values() for lbs in goals.values())
+    distinct = len({lb for goals in normalized.values() for lbs in goals.values() for lb in lbs})
+    print(f"leaderboard occurrences: {occurrences}, distinct records: {distinct}")
+    print(f"RECOMMENDATIONS as loaded: {raw_size:,} bytes")
+    print(f"pooled records:            {normalized_size:,} bytes ({1 - normalized_size / raw_size:.0%} smaller)")
+
+    # One leaderboard's own objects, leaving out the strings both forms hold
+    raw_lb = next(iter(next(iter(raw.values())).values()))[0]
+    record = next(iter(next(iter(normalized.values())).values()))[0]
+    print(f"one leaderboard without its strings: dicts {deep_size(raw_lb, strings=False):,} bytes, "
+          f"record {deep_size(record, strings=False):,} bytes")
+
+    runs = 200
+    dict_time = timeit.timeit(lambda: walk_dicts(raw), number=runs) / runs
+    record_time = timeit.timeit(lambda: walk_records(normalized), number=runs) / runs
+    print(f"walk every leaderboard: dicts {dict_time * 1e6:.1f} us, records {record_time * 1e6:.1f} us")
+
+    catalog = load_catalog()
+    entries = catalog.leaderboard_details.values()
+    distinct = {id(entry): entry for entry in entries}.values()
+    per_node = sum(len(e.cached.body) + len(e.cached_msgpack.body) for e in entries)
+    stored = sum(len(e.cached.body) + len(e.cached_msgpack.body) for e in distinct)
+    print(f"detail bodies: {len(catalog.leaderboard_details)} nodes -> {len(distinct)} distinct entries")
+    print(f"detail bytes (JSON + msgpack): {per_node:,} per node -> {stored:,} stored")
+
+
+if __name__ == '__main__':
+    main()
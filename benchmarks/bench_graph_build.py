@@ -0,0 +1,51 @@
+# ========================================================================
+#   Benchmark: Graph Build
+# ========================================================================
+#
+# Reports import time for processing.py, build time for build_network() and
+# the serialized size of the vis.js payload, for a small selection and for
+# the all-tasks/all-goals view.
+#
+# Usage: python benchmarks/bench_graph_build.py
+
+import os
+import subprocess
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def import_time(runs=5):
+    # Fresh interpreter each run so nothing is already imported
+    code = "import time; t = time.perf_counter(); import processing; print(time.perf_counter() - t)"
+    times = [
+        float(subprocess.check_output([sys.executable, '-c', code], cwd=ROOT))
+        for _ in range(runs)
+    ]
+    return min(times)
+
+
+def main():
+    from catalog import load_catalog
+    from processing import build_network
+    from schemas import encode
+
+    catalog = load_catalog()
+    selections = {
+        'Chat x Speed': (['Chat'], ['Speed']),
+        'all tasks/goals': ([], []),
+    }
+
+    print(f"import processing: {import_time() * 1e3:.1f} ms")
+    for name, (tasks, goals) in selections.items():
+        recs = catalog.selection.select(tasks, goals)
+        runs = 50
+        seconds = timeit.timeit(lambda: build_network(recs), number=runs) / runs
+        payload = encode(build_network(recs))
+        print(f"{name}: build {seconds * 1e3:.2f} ms, payload {len(payload):,} bytes")
+
+
+if __name__ == '__main__':
+    main()
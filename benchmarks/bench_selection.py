@@ -0,0 +1,81 @@
+# ========================================================================
+#   Benchmark: Task/Goal Selection
+# ========================================================================
+#
+# Compares the original nested-loop filter from index() with the bitset
+# SelectionIndex as the catalog grows. The catalog is scaled by cloning
+# every task under a new name, and the selection is held fixed (3 tasks x
+# 2 goals), so the bitset path should stay roughly flat.
+#
+# Usage: python benchmarks/bench_selection.py
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalog import SelectionIndex, load_leaderboard_records
+from recommendations_engine import RECOMMENDATIONS
+
+
+def legacy_filter(recommendations, tasks_selected, goals_selected):
+    # The four-branch filter index() used before the bitset index
+    if tasks_selected and goals_selected:
+        filtered_recs = {}
+        for task, goals in recommendations.items():
+            if task not in tasks_selected:
+                continue
+            filtered_goals = {}
+            for goal, leaderboards in goals.items():
+                if goal not in goals_selected:
+                    continue
+                filtered_goals[goal] = leaderboards
+            if filtered_goals:
+                filtered_recs[task] = filtered_goals
+    elif tasks_selected:
+        filtered_recs = {task: goals for task, goals in recommendations.items() if task in tasks_selected}
+    elif goals_selected:
+        filtered_recs = {}
+        for task, goals in recommendations.items():
+            filtered_goals = {goal: leaderboards for goal, leaderboards in goals.items() if goal in goals_selected}
+            if filtered_goals:
+                filtered_recs[task] = filtered_goals
+    else:
+        filtered_recs = recommendations
+    return filtered_recs
+
+
+def scaled_catalog(factor):
+    # Clone every task under a new name so the catalog grows by `factor`
+    records = load_leaderboard_records(RECOMMENDATIONS)
+    catalog = {}
+    for copy in range(factor):
+        for task, goals in records.items():
+            name = task if copy == 0 else f'{task} #{copy}'
+            catalog[name] = goals
+    return catalog
+
+
+def count_leaderboards(recommendations):
+    return sum(len(lbs) for goals in recommendations.values() for lbs in goals.values())
+
+
+def main():
+    tasks = ['Chat', 'Generate code', 'Generate text']
+    goals = ['Quality', 'Speed']
+
+    print(f"{'scale':>6} {'leaderboards':>13} {'legacy (us)':>12} {'bitset (us)':>12}")
+    for factor in (1, 10, 100):
+        recommendations = scaled_catalog(factor)
+        index = SelectionIndex(recommendations)
+        assert index.select(tasks, goals) == legacy_filter(recommendations, tasks, goals)
+
+        runs = 200
+        legacy = timeit.timeit(lambda: legacy_filter(recommendations, tasks, goals), number=runs) / runs
+        bitset = timeit.timeit(lambda: index.select(tasks, goals), number=runs) / runs
+        print(f"{factor:>5}x {count_leaderboards(recommendations):>13} {legacy * 1e6:>12.1f} {bitset * 1e6:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+# ========================================================================
+#   Benchmark: Serialization
+# ========================================================================
+#
+# Compares encoding the all-tasks/all-goals graph and every leaderboard detail
+# payload with the stdlib json module (on plain dicts, as before) against the
+# msgspec JSON and MessagePack encoders used by the API, and reports body sizes.
+#
+# Usage: python benchmarks/bench_serialization.py
+
+import json
+import os
+import sys
+import timeit
+
+import msgspec
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def report(name, obj, runs=200):
+    builtins = msgspec.to_builtins(obj)
+    encoders = {
+        'json.dumps': lambda: json.dumps(builtins).encode('utf-8'),
+        'msgspec json': lambda: msgspec.json.encode(obj),
+        'msgspec msgpack': lambda: msgspec.msgpack.encode(obj),
+    }
+    print(name)
+    for label, encode in encoders.items():
+        seconds = timeit.timeit(encode, number=runs) / runs
+        print(f"  {label:<16} {seconds * 1e6:9.1f} us  {len(encode()):>9,} bytes")
+
+
+def main():
+    from catalog import load_catalog
+    from processing import build_selection
+
+    catalog = load_catalog()
+    result = build_selection(catalog, [], [])
+    details = [entry.payload for entry in catalog.leaderboard_details.values()]
+
+    report('all tasks/goals graph', result.network_data)
+    report(f'{len(details)} leaderboard details', details)
+
+
+if __name__ == '__main__':
+    main()
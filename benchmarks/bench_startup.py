@@ -0,0 +1,84 @@
+# ========================================================================
+#   Benchmark: Startup
+# ========================================================================
+#
+# Measures cold start: the time for a fresh interpreter to import app (which
+# loads the catalog), once with no catalog snapshot (the catalog is built from
+# catalog_data/ and a snapshot written) and once starting from the snapshot.
+# Also reports the catalog load on its own (pickled snapshot and memory-mapped
+# file) and the slowest imports.
+#
+# Usage: python benchmarks/bench_startup.py
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TIMED_IMPORT = (
+    "import time; t = time.perf_counter(); import app; "
+    "print(time.perf_counter() - t)"
+)
+TIMED_OPEN = (
+    "import catalog, time; t = time.perf_counter(); catalog.open_catalog(); "
+    "print(time.perf_counter() - t)"
+)
+TIMED_MAP = (
+    "import catalog, catalog_mmap, time; t = time.perf_counter(); "
+    "catalog_mmap.open_mapped_catalog(catalog.CATALOG_DIR); print(time.perf_counter() - t)"
+)
+
+
+def run(code, snapshot_dir):
+    env = dict(os.environ, LEADERBOARD_SNAPSHOT_DIR=snapshot_dir)
+    return float(subprocess.check_output([sys.executable, '-c', code], cwd=ROOT, env=env))
+
+
+def best_of(code, runs=5, fresh=False):
+    # fresh=True gives every run an empty snapshot directory
+    times = []
+    snapshot_dir = tempfile.mkdtemp()
+    try:
+        for _ in range(runs):
+            if fresh:
+                shutil.rmtree(snapshot_dir)
+                os.makedirs(snapshot_dir)
+            times.append(run(code, snapshot_dir))
+    finally:
+        shutil.rmtree(snapshot_dir, ignore_errors=True)
+    return min(times)
+
+
+def slowest_imports(count=5):
+    output = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import app'],
+        cwd=ROOT, capture_output=True, text=True
+    ).stderr
+    rows = []
+    for line in output.splitlines():
+        parts = line.split('|')
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            name = parts[2].strip()
+            # Top-level packages only, so nested imports aren't counted twice
+            if '.' not in name:
+                rows.append((int(parts[1]), name))
+    return sorted(rows, reverse=True)[:count]
+
+
+def main():
+    print(f"import app, no snapshot:   {best_of(TIMED_IMPORT, fresh=True) * 1e3:7.1f} ms")
+    print(f"import app, from snapshot: {best_of(TIMED_IMPORT) * 1e3:7.1f} ms")
+    print(f"open_catalog, no snapshot:   {best_of(TIMED_OPEN, fresh=True) * 1e3:5.1f} ms")
+    print(f"open_catalog, from snapshot: {best_of(TIMED_OPEN) * 1e3:5.1f} ms")
+    print(f"open_mapped_catalog, no file:   {best_of(TIMED_MAP, fresh=True) * 1e3:5.1f} ms")
+    print(f"open_mapped_catalog, from file: {best_of(TIMED_MAP) * 1e3:5.1f} ms")
+    print("slowest imports (cumulative):")
+    for micros, name in slowest_imports():
+        print(f"  {name:<24} {micros / 1e3:7.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
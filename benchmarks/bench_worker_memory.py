@@ -0,0 +1,103 @@
+# ========================================================================
+#   Benchmark: Worker Memory
+# ========================================================================
+#
+# Starts gunicorn (gunicorn.conf.py) four ways: every worker loading the app
+# on its own, every worker loading it but mapping the shared catalog file
+# (LEADERBOARD_MMAP_CATALOG=1), and preloading the app in the master and
+# forking the workers from it, without and with gc.freeze(). Each time it sends the same requests, then
+# reports every worker's RSS, USS (memory only that process holds) and PSS (its
+# fair share of shared pages), read from /proc/<pid>/smaps_rollup, so this is
+# Linux only.
+#
+# Usage: python benchmarks/bench_worker_memory.py [workers]
+
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BIND = '127.0.0.1:8765'
+REQUESTS = ['/', '/api/graph', '/api/rows?limit=1000', '/?tasks=Chat&goals=Speed']
+
+
+def memory_kb(pid):
+    fields = {}
+    with open(f'/proc/{pid}/smaps_rollup') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == 'kB':
+                fields[parts[0].rstrip(':')] = int(parts[1])
+    uss = fields['Private_Clean'] + fields['Private_Dirty']
+    return fields['Rss'], uss, fields['Pss']
+
+
+def worker_pids(master_pid):
+    with open(f'/proc/{master_pid}/task/{master_pid}/children') as f:
+        return [int(pid) for pid in f.read().split()]
+
+
+def wait_until_up(timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(f'http://{BIND}/api/cache_stats', timeout=1).read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("gunicorn didn't come up")
+
+
+# (label, preload, gc.freeze, mapped catalog)
+MODES = [
+    ('each worker loads', False, False, False),
+    ('each worker maps the catalog', False, False, True),
+    ('preload, no freeze', True, False, False),
+    ('preload + gc.freeze', True, True, False),
+]
+
+
+def measure(preload, freeze, mapped, workers):
+    env = dict(
+        os.environ,
+        LEADERBOARD_PRELOAD='1' if preload else '0',
+        LEADERBOARD_GC_FREEZE='1' if freeze else '0',
+        LEADERBOARD_MMAP_CATALOG='1' if mapped else '0',
+        LEADERBOARD_WORKERS=str(workers),
+        LEADERBOARD_BIND=BIND,
+    )
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py'],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        wait_until_up()
+        # Enough requests that every worker serves some of each kind
+        for _ in range(workers * 5):
+            for path in REQUESTS:
+                request = urllib.request.Request(f'http://{BIND}{path}', headers={'Accept-Encoding': 'br, gzip'})
+                urllib.request.urlopen(request).read()
+        # Let workers that load on their own finish their background compression
+        time.sleep(5)
+        return [memory_kb(pid) for pid in worker_pids(server.pid)]
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    for label, preload, freeze, mapped in MODES:
+        stats = measure(preload, freeze, mapped, workers)
+        print(f"{label} ({workers} workers):")
+        for rss, uss, pss in stats:
+            print(f"  RSS {rss / 1024:6.1f} MiB  USS {uss / 1024:6.1f} MiB  PSS {pss / 1024:6.1f} MiB")
+        print(f"  mean USS {sum(s[1] for s in stats) / len(stats) / 1024:.1f} MiB, "
+              f"total PSS {sum(s[2] for s in stats) / 1024:.1f} MiB")
+
+
+if __name__ == '__main__':
+    main()
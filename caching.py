@@ -0,0 +1,279 @@
+# ========================================================================
+#   Imports
+# ========================================================================
+
+import gzip
+import hashlib
+import logging
+import os
+import queue
+import threading
+import weakref
+from collections import OrderedDict
+
+try:
+    import brotli
+except ImportError:  # Optional: without it only gzip variants are stored
+    brotli = None
+
+
+# ========================================================================
+#   Code Versions
+# ========================================================================
+
+def source_digest(*paths):
+    """
+    Hashes the source files that build some derived data. Files cached on disk
+    are keyed on it as well as on the catalog version, so editing the code that
+    builds them invalidates them too.
+
+    Args:
+        paths (str): Source files, e.g. a module's __file__.
+
+    Returns:
+        str: A short hex digest.
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+
+# ========================================================================
+#   Bounded LRU Cache
+# ========================================================================
+
+class LRUCache:
+    """
+    Thread-safe, bounded least-recently-used cache with hit/miss/eviction counters.
+
+    Args:
+        maxsize (int): Maximum number of entries kept before the oldest is evicted.
+        name (str): Label used when reporting stats.
+    """
+
+    def __init__(self, maxsize=128, name='cache'):
+        self.maxsize = maxsize
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        """Returns the cached value for key (marking it recently used) or default."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Stores value under key, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_build(self, key, build):
+        """
+        Returns the cached value for key, calling build() to create it on a miss.
+
+        build() runs outside the lock, so two threads missing on the same key at
+        once may both build it; the last one stored wins, which is harmless for
+        the immutable values cached here.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = build()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        """Returns the cache's counters as a dict."""
+        return {
+            'name': self.name,
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
+_MISSING = object()
+
+
+# ========================================================================
+#   Cached Response Bodies
+# ========================================================================
+
+# Bodies smaller than this gain less from compression than the header costs
+MIN_COMPRESS_SIZE = 512
+
+# Content codings in order of preference when a client accepts several equally
+CONTENT_ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+class CachedBody:
+    """
+    A fully rendered response body with its strong, content-hash ETag.
+
+    Compressible bodies are also stored gzip- and (if the brotli package is
+    installed) brotli-encoded at maximum level. Compression runs once per body on
+    a background worker, so the request path only ever picks a stored variant;
+    until the variants are ready the identity body is served.
+
+    Args:
+        body (bytes): The encoded response body.
+        mimetype (str): Content type the body is served as.
+    """
+
+    __slots__ = ('body', 'mimetype', 'etag', 'variants', '__weakref__')
+
+    def __init__(self, body, mimetype):
+        self.body = body
+        self.mimetype = mimetype
+        self.etag = hashlib.sha256(body).hexdigest()[:32]
+        # Maps content coding -> compressed body; replaced wholesale, never mutated
+        self.variants = {}
+        self._schedule_compression()
+
+    def __getstate__(self):
+        return (self.body, self.mimetype, self.etag, self.variants)
+
+    def __setstate__(self, state):
+        # Bodies unpickled from a snapshot keep their variants; any without them still get compressed
+        self.body, self.mimetype, self.etag, self.variants = state
+        if not self.variants:
+            self._schedule_compression()
+
+    def _schedule_compression(self):
+        if self.compressible:
+            _compress_queue.put(weakref.ref(self))
+            _ensure_compressor()
+
+    @property
+    def compressible(self):
+        return len(self.body) >= MIN_COMPRESS_SIZE
+
+    def compress(self):
+        """Builds the compressed variants, keeping only those smaller than the body."""
+        variants = {'gzip': gzip.compress(self.body, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            variants['br'] = brotli.compress(self.body, quality=11)
+        self.variants = {
+            coding: data for coding, data in variants.items() if len(data) < len(self.body)
+        }
+
+    def select(self, accept_encodings):
+        """
+        Picks the best stored variant for a request's Accept-Encoding header.
+
+        Args:
+            accept_encodings: The request's parsed Accept-Encoding header.
+
+        Returns:
+            tuple: (content coding or None for identity, body bytes, ETag).
+        """
+        variants = self.variants
+        best = accept_encodings.best_match([c for c in CONTENT_ENCODINGS if c in variants])
+        if best is None:
+            return None, self.body, self.etag
+        # Each representation needs its own strong ETag
+        return best, variants[best], f"{self.etag}-{best}"
+
+
+# Levels for bodies compressed while the request waits: far cheaper than the
+# maximum levels used for cached bodies, for most of the size reduction
+FAST_GZIP_LEVEL = 6
+FAST_BROTLI_QUALITY = 5
+
+
+def compress_for_request(body, accept_encodings):
+    """
+    Compresses a body that isn't worth caching (or whose cached variants aren't
+    ready yet) for one response, using the client's preferred coding.
+
+    Args:
+        body (bytes): The identity body.
+        accept_encodings: The request's parsed Accept-Encoding header.
+
+    Returns:
+        tuple: (content coding or None for identity, body bytes).
+    """
+    if len(body) < MIN_COMPRESS_SIZE:
+        return None, body
+    best = accept_encodings.best_match(CONTENT_ENCODINGS)
+    if best == 'br':
+        return best, brotli.compress(body, quality=FAST_BROTLI_QUALITY)
+    if best == 'gzip':
+        return best, gzip.compress(body, compresslevel=FAST_GZIP_LEVEL, mtime=0)
+    return None, body
+
+
+# Pending bodies, held weakly so ones whose catalog version or cache entry is gone
+# by the time they come up are skipped instead of compressed for nobody
+_compress_queue = queue.Queue()
+_compressor = None
+_compressor_lock = threading.Lock()
+
+
+def _ensure_compressor():
+    global _compressor
+    if _compressor is not None:
+        return
+    with _compressor_lock:
+        if _compressor is None:
+            _compressor = threading.Thread(target=_compress_worker, name='body-compressor', daemon=True)
+            _compressor.start()
+
+
+def _compress_worker():
+    pending = _compress_queue
+    while True:
+        cached = pending.get()()
+        try:
+            if cached is not None:
+                cached.compress()
+        except Exception:
+            logging.exception("Failed to precompress a cached response body")
+        finally:
+            pending.task_done()
+
+
+def wait_for_compression():
+    """
+    Blocks until every body queued so far has its compressed variants. Called
+    before forking workers, so they inherit the variants instead of redoing them.
+    """
+    _compress_queue.join()
+
+
+def _reset_compressor_after_fork():
+    # The compressor thread doesn't survive fork() and the inherited queue may be
+    # mid-operation, so a forked child starts a fresh queue and thread on demand.
+    # Anything still queued in the parent is served uncompressed in the child.
+    global _compress_queue, _compressor, _compressor_lock
+    _compress_queue = queue.Queue()
+    _compressor = None
+    _compressor_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_compressor_after_fork)
@@ -0,0 +1,872 @@
+# ========================================================================
+#   Imports
+# ========================================================================
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
+
+import msgspec
+
+import caching
+import schemas
+from caching import CachedBody, source_digest, wait_for_compression
+from schemas import JSON_MIMETYPE, MSGPACK_MIMETYPE, BenchmarkDetail, LeaderboardDetail, encode
+
+
+# ========================================================================
+#   Catalog Source
+# ========================================================================
+
+# The catalog lives in catalog_data/: questions.json plus one JSON file per task
+# under tasks/, whose file names sort in catalog order (01-chain-agents.json, ...)
+CATALOG_DIR = os.environ.get(
+    'LEADERBOARD_CATALOG_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'catalog_data')
+)
+QUESTIONS_FILE = 'questions.json'
+TASKS_DIR = 'tasks'
+
+# How often (in seconds) the background watcher checks the files for changes
+DEFAULT_POLL_INTERVAL = 2.0
+
+# Threads used to read and parse task files when several need loading at once
+LOAD_WORKERS = 8
+
+# Where prebuilt catalog snapshots are kept, one pickle per catalog version
+SNAPSHOT_DIR = os.environ.get(
+    'LEADERBOARD_SNAPSHOT_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.catalog_snapshot')
+)
+
+
+def questions_path(directory=CATALOG_DIR):
+    return os.path.join(directory, QUESTIONS_FILE)
+
+
+def task_file_paths(directory=CATALOG_DIR):
+    """Returns the task data files in catalog order."""
+    tasks_dir = os.path.join(directory, TASKS_DIR)
+    return [
+        os.path.join(tasks_dir, name)
+        for name in sorted(os.listdir(tasks_dir))
+        if name.endswith('.json')
+    ]
+
+
+# ========================================================================
+#   Node IDs
+# ========================================================================
+
+def _escape_id_part(part):
+    # Escape '%' first so the escaped '_' can't be confused with a literal '%5F'
+    return part.replace('%', '%25').replace('_', '%5F')
+
+
+def _unescape_id_part(part):
+    return part.replace('%5F', '_').replace('%25', '%')
+
+
+def make_node_id(kind, *parts):
+    """
+    Builds a canonical graph node ID, e.g. 'leaderboard_Chat_Quality_KLU'.
+
+    Underscores inside a part are escaped, so task, goal, leaderboard and
+    benchmark names can contain underscores without breaking parse_node_id().
+    """
+    return '_'.join([kind] + [_escape_id_part(part) for part in parts])
+
+
+def parse_node_id(node_id):
+    """
+    Splits a canonical node ID back into its kind and unescaped parts.
+
+    Returns:
+        tuple: (kind, [part, ...])
+    """
+    kind, *parts = node_id.split('_')
+    return kind, [_unescape_id_part(part) for part in parts]
+
+
+# ========================================================================
+#   Catalog Records
+# ========================================================================
+
+class Link(msgspec.Struct, frozen=True, gc=False):
+    """A link shown in the catalog: the leaderboard itself or its methodology page."""
+    text: str
+    url: str
+
+
+class Benchmark(msgspec.Struct, frozen=True, gc=False):
+    """One benchmark a leaderboard reports."""
+    name: str
+    measures: str
+    score_interpretation: str
+
+
+class Leaderboard(msgspec.Struct, frozen=True, gc=False):
+    """
+    One leaderboard as listed under a task/goal.
+
+    Records are immutable and hashable, so equal records are stored once and
+    can key memoized work (e.g. the detail payload) directly.
+    """
+    name: str
+    abbrev: str
+    tooltip: str
+    link: Link
+    methodology: Link
+    analysis_tips: Tuple[str, ...]
+    benchmarks: Tuple[Benchmark, ...]
+
+
+EMPTY_LINK = Link(text='', url='')
+
+
+def _pooled(pool, record):
+    # Hands back the first equal record seen, so duplicates share one instance
+    return pool.setdefault(record, record)
+
+
+def _load_link(raw, pool):
+    if not raw:
+        return EMPTY_LINK
+    return _pooled(pool, Link(text=sys.intern(raw.get('text', '')), url=sys.intern(raw.get('url', ''))))
+
+
+def load_leaderboard(raw, pool):
+    """
+    Converts one leaderboard dict from the catalog source into a Leaderboard.
+
+    Args:
+        raw (dict): The leaderboard as written in RECOMMENDATIONS.
+        pool (dict): Records built so far; equal records, links, benchmarks and
+            tips tuples come back as the instance already in the pool.
+    """
+    name = sys.intern(raw['leaderboard'])
+    benchmarks = tuple(
+        _pooled(pool, Benchmark(
+            name=sys.intern(bench.get('benchmark_name', 'Unknown Benchmark')),
+            measures=sys.intern(bench.get('benchmark_measures', '')),
+            score_interpretation=sys.intern(bench.get('score_interpretation', '')),
+        ))
+        for bench in raw.get('benchmarks', [])
+    )
+    return _pooled(pool, Leaderboard(
+        name=name,
+        abbrev=sys.intern(raw.get('leaderboard_abbrev', name)),
+        tooltip=sys.intern(raw.get('tooltip', '')),
+        link=_load_link(raw.get('leaderboard_link'), pool),
+        methodology=_load_link(raw.get('methodology'), pool),
+        analysis_tips=_pooled(pool, tuple(sys.intern(tip) for tip in raw.get('analysis_tips', []))),
+        benchmarks=_pooled(pool, benchmarks),
+    ))
+
+
+def _seed_pool(pool, lb):
+    # Registers an already-built record (and its parts) so new records reuse them
+    for part in (lb.link, lb.methodology, lb.analysis_tips, lb.benchmarks, *lb.benchmarks, lb):
+        _pooled(pool, part)
+
+
+def load_task_goals(goals, pool):
+    """Converts one task's goal -> leaderboard dicts into goal -> tuple of Leaderboard records."""
+    return {
+        sys.intern(goal): tuple(load_leaderboard(raw, pool) for raw in leaderboards)
+        for goal, leaderboards in goals.items()
+    }
+
+
+def load_leaderboard_records(recommendations):
+    """
+    Converts a raw RECOMMENDATIONS structure into Leaderboard records.
+
+    The same leaderboard block is pasted under many task/goal pairs, usually with
+    a few tips or benchmarks changed. Pooling records by value is what dedupes
+    them: identical copies become one record, and copies that differ still share
+    every unchanged string, link, benchmark and tips tuple.
+
+    Args:
+        recommendations (dict): Task -> goal -> list of leaderboard dicts.
+
+    Returns:
+        dict: The same task -> goal shape with a tuple of Leaderboard records per goal.
+    """
+    pool = {}
+    return {sys.intern(task): load_task_goals(goals, pool) for task, goals in recommendations.items()}
+
+
+# ========================================================================
+#   Integer Node Table
+# ========================================================================
+
+def build_node_table(recommendations):
+    """
+    Numbers every node of the full catalog graph with a dense integer ID.
+
+    Nodes are numbered in the order build_network() emits them (start, then each
+    task, goal, leaderboard and benchmark), so the numbering only changes when the
+    catalog does.
+
+    Returns:
+        tuple: (node_table, node_numbers), where node_table[i] is the
+        (kind, task, goal, leaderboard, benchmark) tuple for node i (unused parts
+        are None) and node_numbers maps canonical string IDs to their integer.
+    """
+    node_table = []
+    node_numbers = {}
+
+    def add(kind, *parts):
+        node_id = make_node_id(kind, *parts)
+        if node_id not in node_numbers:
+            node_numbers[node_id] = len(node_table)
+            node_table.append((kind,) + parts + (None,) * (4 - len(parts)))
+
+    add('start')
+    for task, goals in recommendations.items():
+        add('task', task)
+        for goal, leaderboards in goals.items():
+            add('goal', task, goal)
+            for lb in leaderboards:
+                add('leaderboard', task, goal, lb.name)
+                for benchmark in lb.benchmarks:
+                    add('benchmark', task, goal, lb.name, benchmark.name)
+
+    return node_table, node_numbers
+
+
+# ========================================================================
+#   Leaderboard Details
+# ========================================================================
+
+def build_leaderboard_detail(lb):
+    """Builds the payload the leaderboard modal renders for one leaderboard."""
+    bench_obj = {
+        bench.name: BenchmarkDetail(measures=bench.measures, score_interpretation=bench.score_interpretation)
+        for bench in lb.benchmarks
+    }
+
+    return LeaderboardDetail(
+        leaderboard=lb.name,
+        tooltip=lb.tooltip,
+        analysis_tips=list(lb.analysis_tips),
+        benchmarks=bench_obj,
+        leaderboard_link=lb.link.url,
+        methodology_url=lb.methodology.url,
+    )
+
+
+class DetailEntry:
+    """A prebuilt LeaderboardDetail plus its serialized, ETagged JSON and MessagePack bodies."""
+
+    __slots__ = ('payload', 'cached', 'cached_msgpack')
+
+    def __init__(self, payload):
+        self.payload = payload
+        self.cached = CachedBody(encode(payload), JSON_MIMETYPE)
+        self.cached_msgpack = CachedBody(encode(payload, MSGPACK_MIMETYPE), MSGPACK_MIMETYPE)
+
+
+def build_detail_index(recommendations, previous_entries=None):
+    """
+    Maps every leaderboard node ID to its prebuilt detail payload.
+
+    If a task/goal lists the same leaderboard twice, the first one wins,
+    matching the node build_network() keeps. Nodes whose details are identical
+    share a single DetailEntry.
+
+    Args:
+        recommendations (dict): Task -> goal -> tuple of Leaderboard records.
+        previous_entries (dict): The previous snapshot's Leaderboard -> DetailEntry
+            map; entries for unchanged leaderboards are reused rather than rebuilt.
+
+    Returns:
+        tuple: (details, entries): node ID -> DetailEntry, and Leaderboard -> DetailEntry.
+    """
+    details = {}
+    # Records are hashable, so equal leaderboards share one entry (and its compressed bodies)
+    entries = {}
+    previous_entries = previous_entries or {}
+    for task, goals in recommendations.items():
+        for goal, leaderboards in goals.items():
+            for lb in leaderboards:
+                node_id = make_node_id('leaderboard', task, goal, lb.name)
+                if node_id not in details:
+                    if lb not in entries:
+                        entry = previous_entries.get(lb)
+                        entries[lb] = entry if entry is not None else DetailEntry(build_leaderboard_detail(lb))
+                    details[node_id] = entries[lb]
+    return details, entries
+
+
+# ========================================================================
+#   Selection Index (Bitsets)
+# ========================================================================
+
+# Canonical value for a filter whose names were all unknown. No task or goal can
+# be named with a NUL, so it matches no entries, and it stays JSON-serializable
+# for selection tokens.
+NO_MATCH = ('\0',)
+
+
+class SelectionIndex:
+    """
+    Resolves task/goal selections with bitset operations.
+
+    Every (task, goal, leaderboard, benchmark) entry gets an integer position
+    when the catalog loads, and each task and goal stores the positions it
+    covers as the bits of a Python int. A selection is then an OR across the
+    chosen tasks, an OR across the chosen goals, an AND of the two and a gather.
+
+    Entries are laid out task by task and goal by goal, so each (task, goal)
+    group occupies a contiguous run of bits.
+    """
+
+    def __init__(self, recommendations):
+        self.recommendations = recommendations
+        self.entries = []          # position -> (task, goal, leaderboard, benchmark)
+        self.entry_groups = []     # position -> index into self.groups
+        self.groups = []           # (task, goal) in catalog order
+        self.group_ends = []       # first position after each group
+        self.task_bits = {}
+        self.goal_bits = {}
+
+        for task, goals in recommendations.items():
+            for goal, leaderboards in goals.items():
+                group = len(self.groups)
+                start = len(self.entries)
+                for lb in leaderboards:
+                    # Leaderboards without benchmarks still get a position so they stay selectable
+                    for benchmark in lb.benchmarks or (None,):
+                        self.entries.append((task, goal, lb, benchmark))
+                if start == len(self.entries):
+                    self.entries.append((task, goal, None, None))
+                end = len(self.entries)
+
+                self.groups.append((task, goal))
+                self.group_ends.append(end)
+                self.entry_groups.extend([group] * (end - start))
+
+                bits = ((1 << (end - start)) - 1) << start
+                self.task_bits[task] = self.task_bits.get(task, 0) | bits
+                self.goal_bits[goal] = self.goal_bits.get(goal, 0) | bits
+
+        self.all_bits = (1 << len(self.entries)) - 1
+
+    def canonicalize(self, tasks=None, goals=None):
+        """
+        Returns a canonical (tasks, goals) pair for a selection: known names only,
+        deduplicated and sorted. Unknown names are dropped, so parameter order and
+        junk values can't produce different keys for the same selection.
+
+        A filter whose names are all unknown becomes NO_MATCH rather than an empty
+        tuple, so a mistyped or renamed task narrows the selection to nothing
+        instead of widening it to the whole catalog.
+        """
+        return self._canonical(tasks, self.task_bits), self._canonical(goals, self.goal_bits)
+
+    @staticmethod
+    def _canonical(names, bits):
+        if not names:
+            return ()
+        known = tuple(sorted(frozenset(name for name in names if name in bits)))
+        return known or NO_MATCH
+
+    def mask(self, tasks=None, goals=None):
+        """
+        Returns the bitset of entries matching the selection.
+
+        An empty (or None) tasks or goals list means "don't filter on it";
+        unknown names simply contribute no bits.
+        """
+        mask = self.all_bits
+        if tasks:
+            task_mask = 0
+            for task in tasks:
+                task_mask |= self.task_bits.get(task, 0)
+            mask &= task_mask
+        if goals:
+            goal_mask = 0
+            for goal in goals:
+                goal_mask |= self.goal_bits.get(goal, 0)
+            mask &= goal_mask
+        return mask
+
+    @staticmethod
+    def positions(mask):
+        """Yields the positions of the set bits in mask, lowest first."""
+        bits = bin(mask)[:1:-1]
+        pos = bits.find('1')
+        while pos != -1:
+            yield pos
+            pos = bits.find('1', pos + 1)
+
+    def select(self, tasks=None, goals=None):
+        """
+        Returns the recommendations filtered to the selection, in the same
+        {task: {goal: [leaderboard, ...]}} shape as RECOMMENDATIONS.
+        """
+        bits = bin(self.mask(tasks, goals))[:1:-1]
+        selected = {}
+
+        # A group is either fully selected or not at all, so skip to its end after the first hit
+        pos = bits.find('1')
+        while pos != -1:
+            group = self.entry_groups[pos]
+            task, goal = self.groups[group]
+            selected.setdefault(task, {})[goal] = self.recommendations[task][goal]
+            pos = bits.find('1', self.group_ends[group])
+        return selected
+
+
+# ========================================================================
+#   Catalog Snapshot
+# ========================================================================
+
+class Catalog:
+    """
+    Immutable snapshot of the questions and recommendations data.
+
+    A snapshot is fully built before it's published, so readers either see the
+    previous catalog or the new one, never something in between.
+
+    Attributes:
+        questions (dict): The question flow from questions.json.
+        sources (tuple): The TaskSource for each task file, in catalog order.
+        recommendations (dict): Task -> goal -> tuple of Leaderboard records.
+        version (str): Content hash of the files the snapshot was built from.
+        leaderboard_details (dict): Leaderboard node ID -> DetailEntry.
+        detail_entries (dict): Leaderboard -> DetailEntry, reused by the next snapshot.
+        selection (SelectionIndex): Bitset index for task/goal filtering.
+        node_table (list): Integer node ID -> (kind, task, goal, leaderboard, benchmark).
+        node_numbers (dict): Canonical string node ID -> integer node ID.
+    """
+
+    def __init__(self, questions, sources, version, previous=None):
+        self.questions = questions
+        self.sources = tuple(sources)
+        self.recommendations = recommendations = {source.task: source.goals for source in sources}
+        self.version = version
+
+        # Derived indexes are built here, before the snapshot is published. Detail
+        # entries are the expensive part (encoding plus precompression), so those
+        # for leaderboards the previous snapshot already had are carried over
+        previous_entries = previous.detail_entries if previous is not None else None
+        self.leaderboard_details, self.detail_entries = build_detail_index(recommendations, previous_entries)
+        self.selection = SelectionIndex(recommendations)
+        self.node_table, self.node_numbers = build_node_table(recommendations)
+
+    def node_string_id(self, node_ref):
+        """
+        Resolves a node reference to its canonical string ID.
+
+        Accepts an integer node ID (as an int or a string of digits) from this
+        version's node table, or a canonical string ID, which is returned as is.
+        Returns None for integers outside the table.
+        """
+        if isinstance(node_ref, str) and not node_ref.isdigit():
+            return node_ref
+        try:
+            number = int(node_ref)
+        except (TypeError, ValueError):
+            return None
+        if not 0 <= number < len(self.node_table):
+            return None
+        kind, *parts = self.node_table[number]
+        return make_node_id(kind, *[part for part in parts if part is not None])
+
+    def leaderboard_detail(self, node_ref):
+        """Returns the DetailEntry for an integer or string node ID, or None."""
+        node_id = self.node_string_id(node_ref)
+        return self.leaderboard_details.get(node_id) if node_id is not None else None
+
+
+class TaskSource:
+    """
+    One task file as loaded: its records plus the mtime and content hash used to
+    tell whether it has changed since.
+    """
+
+    __slots__ = ('path', 'mtime', 'digest', 'task', 'goals')
+
+    def __init__(self, path, mtime, digest, task, goals):
+        self.path = path
+        self.mtime = mtime
+        self.digest = digest
+        self.task = task
+        self.goals = goals
+
+
+def read_task_source(path, pool, previous=None):
+    """
+    Reads one task file into a TaskSource.
+
+    Args:
+        path (str): The task's JSON file.
+        pool (dict): Record pool shared by the whole catalog (see load_leaderboard).
+        previous (TaskSource): The file as last loaded; if its content hash still
+            matches, its records are reused instead of parsing the file again.
+    """
+    mtime = os.stat(path).st_mtime_ns
+    with open(path, 'rb') as f:
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()
+
+    if previous is not None and previous.digest == digest:
+        return TaskSource(path, mtime, digest, previous.task, previous.goals)
+
+    raw = json.loads(data)
+    return TaskSource(path, mtime, digest, sys.intern(raw['task']), load_task_goals(raw['goals'], pool))
+
+
+def catalog_version(questions_digest, task_digests):
+    """
+    Content hash identifying a catalog: the questions file plus each task file's
+    name (which fixes its order) and contents.
+
+    Args:
+        questions_digest (str): sha256 hex digest of questions.json.
+        task_digests (list): (path, sha256 hex digest) for each task file, in order.
+    """
+    version_hash = hashlib.sha256(bytes.fromhex(questions_digest))
+    for path, digest in task_digests:
+        version_hash.update(os.path.basename(path).encode('utf-8') + bytes.fromhex(digest))
+    return version_hash.hexdigest()[:16]
+
+
+def load_catalog(directory=CATALOG_DIR, previous=None, force=False):
+    """
+    Loads the catalog files into a new snapshot.
+
+    Task files are read and parsed on a thread pool. Given the previous snapshot,
+    only files whose mtime changed are read again (all of them with force), only
+    those whose content hash changed are parsed again, and everything derived
+    from unchanged leaderboards is carried over.
+
+    Args:
+        directory (str): The catalog data directory.
+        previous (Catalog): The snapshot currently being served, if any.
+        force (bool): Re-read every file even if its mtime is unchanged.
+
+    Returns:
+        Catalog: A new, fully built snapshot, or previous itself if nothing changed.
+    """
+    with open(questions_path(directory), 'rb') as f:
+        questions_data = f.read()
+
+    paths = task_file_paths(directory)
+    previous_sources = {source.path: source for source in previous.sources} if previous is not None else {}
+
+    sources = [None] * len(paths)
+    stale = []
+    pool = {}
+    for i, path in enumerate(paths):
+        old = previous_sources.get(path)
+        if old is not None and not force and os.stat(path).st_mtime_ns == old.mtime:
+            sources[i] = old
+        else:
+            stale.append(i)
+
+    # The previous snapshot's records seed the pool, so re-parsed tasks share
+    # every unchanged record, link, benchmark and tips tuple with it
+    for source in previous_sources.values():
+        for leaderboards in source.goals.values():
+            for lb in leaderboards:
+                _seed_pool(pool, lb)
+
+    if stale:
+        with ThreadPoolExecutor(max_workers=min(LOAD_WORKERS, len(stale))) as executor:
+            loaded = executor.map(
+                lambda i: read_task_source(paths[i], pool, previous_sources.get(paths[i])),
+                stale
+            )
+            for i, source in zip(stale, loaded):
+                sources[i] = source
+
+    tasks = [source.task for source in sources]
+    if len(set(tasks)) != len(tasks):
+        raise ValueError(f"Duplicate task names in {os.path.join(directory, TASKS_DIR)}")
+
+    version = catalog_version(
+        hashlib.sha256(questions_data).hexdigest(),
+        [(source.path, source.digest) for source in sources]
+    )
+    if previous is not None and version == previous.version and not force:
+        return previous  # Touched but not edited: nothing to rebuild
+
+    return Catalog(json.loads(questions_data), sources, version, previous)
+
+
+# ========================================================================
+#   Binary Snapshots
+# ========================================================================
+#
+# A snapshot is the fully built Catalog (records, detail bodies with their
+# compressed variants, selection index, node table) pickled under its version,
+# so a worker can start without parsing a single task file. Build one with
+#
+#     python catalog.py
+#
+# Snapshots are only ever written by this module into SNAPSHOT_DIR, which must
+# not be writable by anyone untrusted, since loading one unpickles it.
+
+# Hash of the code that builds a Catalog (records, detail bodies, their encoding
+# and compression). Snapshots are keyed on it as well as on the catalog version,
+# so a code change rebuilds them instead of serving what the old code built.
+SNAPSHOT_CODE_VERSION = source_digest(__file__, schemas.__file__, caching.__file__)
+
+
+def _snapshot_path(version, snapshot_dir):
+    return os.path.join(snapshot_dir, f'catalog-{version}-{SNAPSHOT_CODE_VERSION}.pickle')
+
+
+def current_version(directory=CATALOG_DIR):
+    """Hashes the catalog files (without parsing them) to get the version they'd build."""
+    def file_digest(path):
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    return catalog_version(
+        file_digest(questions_path(directory)),
+        [(path, file_digest(path)) for path in task_file_paths(directory)]
+    )
+
+
+def write_snapshot(catalog, snapshot_dir=SNAPSHOT_DIR):
+    """Pickles a catalog under its version, replacing any older snapshots."""
+    # Write to a temp file and rename so a crash never leaves a half-written snapshot
+    try:
+        os.makedirs(snapshot_dir, exist_ok=True)
+        path = _snapshot_path(catalog.version, snapshot_dir)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(catalog, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+        for name in os.listdir(snapshot_dir):
+            if name.startswith('catalog-') and name.endswith('.pickle') and name != os.path.basename(path):
+                os.remove(os.path.join(snapshot_dir, name))
+    except OSError as e:
+        logging.warning(f"Could not write catalog snapshot: {str(e)}")
+
+
+def read_snapshot(version, snapshot_dir=SNAPSHOT_DIR):
+    """Returns the snapshot built for version, or None if there isn't a usable one."""
+    try:
+        with open(_snapshot_path(version, snapshot_dir), 'rb') as f:
+            catalog = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        # A truncated or otherwise corrupt snapshot; rebuild it
+        logging.warning(f"Ignoring unreadable catalog snapshot: {str(e)}")
+        return None
+    return catalog if getattr(catalog, 'version', None) == version else None
+
+
+def open_catalog(directory=CATALOG_DIR, snapshot_dir=SNAPSHOT_DIR):
+    """
+    Loads the catalog from its snapshot if one matches the files' current content
+    hash, otherwise from the files themselves (then writes a snapshot for the next
+    worker to start from).
+    """
+    catalog = read_snapshot(current_version(directory), snapshot_dir)
+    if catalog is None:
+        catalog = build_snapshot(directory, snapshot_dir)
+    return catalog
+
+
+def build_snapshot(directory=CATALOG_DIR, snapshot_dir=SNAPSHOT_DIR):
+    """
+    The build step: loads the catalog from its files, waits for every detail body
+    to be compressed so workers starting from the snapshot never have to, and
+    writes the snapshot.
+    """
+    catalog = load_catalog(directory)
+    # The bodies were queued for the background compressor as they were built
+    wait_for_compression()
+    write_snapshot(catalog, snapshot_dir)
+    return catalog
+
+
+# ========================================================================
+#   Catalog Store (Hot Reload)
+# ========================================================================
+
+class CatalogStore:
+    """
+    Holds the current Catalog and swaps in a new one when the files change.
+
+    Changes are picked up by a background thread that polls the files' mtimes
+    or by sending the process SIGHUP. Only changed task files are re-read, and
+    a file whose content hash is unchanged isn't parsed again. Publishing a new
+    snapshot is a single reference assignment, so request handlers never need a
+    lock to read it.
+
+    With mapped=True the catalog is served from a memory-mapped file shared by
+    every process (see catalog_mmap). One process builds each new version,
+    incrementally from the pickled snapshot of the version it was serving, and
+    writes the version's mapped file and snapshot; the rest map that file. No
+    process keeps the built Catalog once it's mapped.
+    """
+
+    def __init__(self, directory=CATALOG_DIR, poll_interval=DEFAULT_POLL_INTERVAL, snapshot_dir=SNAPSHOT_DIR,
+                 mapped=False):
+        self.directory = directory
+        self.poll_interval = poll_interval
+        self.snapshot_dir = snapshot_dir
+        self.mapped = mapped
+        self.reload_count = 0
+
+        # Only reloads are serialized; reads go straight to self._catalog
+        self._reload_lock = threading.Lock()
+        self._watcher = None
+        self._restarts_after_fork = False
+        self._mtimes = self._file_mtimes()
+        if mapped:
+            # Imported here since catalog_mmap builds on this module
+            from catalog_mmap import open_mapped_catalog
+            self._catalog = open_mapped_catalog(directory, snapshot_dir)
+        else:
+            self._catalog = open_catalog(directory, snapshot_dir)
+
+    @property
+    def current(self):
+        """The most recently published Catalog."""
+        return self._catalog
+
+    def _file_mtimes(self):
+        # Covers added and removed task files as well as edited ones
+        paths = [questions_path(self.directory), *task_file_paths(self.directory)]
+        return {path: os.stat(path).st_mtime_ns for path in paths}
+
+    def reload(self, force=False):
+        """
+        Rebuilds the catalog from whichever files have changed.
+
+        Args:
+            force (bool): Re-read every file and publish a new snapshot even if
+                the content is unchanged.
+
+        Returns:
+            bool: True if a new snapshot was published.
+        """
+        with self._reload_lock:
+            previous = self._catalog
+            try:
+                self._mtimes = self._file_mtimes()
+                if self.mapped:
+                    return self._reload_mapped(previous, force)
+                catalog = load_catalog(self.directory, previous, force=force)
+            except Exception as e:
+                # Keep serving the last good snapshot if the edit is broken
+                logging.error(f"Catalog reload failed, keeping version {previous.version}: {str(e)}")
+                return False
+
+            if catalog.version == previous.version and not force:
+                return False
+            self._publish(catalog, f"{self._parsed_files(previous, catalog)} of {len(catalog.sources)} task files parsed")
+            return True
+
+    def _reload_mapped(self, previous, force):
+        # Every worker's watcher sees the same edit. The first to take the build
+        # lock builds the new version and writes its mapped file and pickled
+        # snapshot; the others find the file when they get the lock and map it.
+        # Imported here since catalog_mmap builds on this module
+        from catalog_mmap import build_lock, map_catalog, open_mapped_file
+
+        version = current_version(self.directory)
+        if version == previous.version and not force:
+            return False
+
+        with build_lock(self.snapshot_dir):
+            mapped = open_mapped_file(version, self.snapshot_dir) if not force else None
+            if mapped is not None:
+                self._publish(mapped, "mapped from another process's build")
+                return True
+
+            # A MappedCatalog has no sources or detail entries to reuse, so build
+            # on the pickled snapshot of the version being served
+            base = read_snapshot(previous.version, self.snapshot_dir) or previous
+            catalog = load_catalog(self.directory, base, force=force)
+            if catalog.version == previous.version and not force:
+                return False
+            mapped = map_catalog(catalog, self.snapshot_dir)
+            # The next build (in whichever process) starts from this version's snapshot
+            wait_for_compression()
+            write_snapshot(catalog, self.snapshot_dir)
+
+        self._publish(mapped, f"{self._parsed_files(base, catalog)} of {len(catalog.sources)} task files parsed")
+        return True
+
+    @staticmethod
+    def _parsed_files(base, catalog):
+        base_goals = {id(source.goals) for source in base.sources}
+        return sum(1 for source in catalog.sources if id(source.goals) not in base_goals)
+
+    def _publish(self, catalog, detail):
+        self._catalog = catalog
+        self.reload_count += 1
+        logging.info(f"Catalog reloaded: version {catalog.version} ({detail})")
+
+    def _has_changed(self):
+        try:
+            return self._file_mtimes() != self._mtimes
+        except OSError:
+            # A file vanished mid-scan (e.g. an editor's atomic save); check next time
+            return False
+
+    def _watch(self):
+        while True:
+            time.sleep(self.poll_interval)
+            if self._has_changed():
+                self.reload()
+
+    def start_watcher(self):
+        """
+        Starts the background mtime watcher (once per process). Threads don't
+        survive fork(), so worker processes forked afterwards start their own.
+        """
+        if self._watcher is None or not self._watcher.is_alive():
+            self._watcher = threading.Thread(target=self._watch, name='catalog-watcher', daemon=True)
+            self._watcher.start()
+            if not self._restarts_after_fork and hasattr(os, 'register_at_fork'):
+                os.register_at_fork(after_in_child=self._restart_watcher_after_fork)
+                self._restarts_after_fork = True
+
+    def _restart_watcher_after_fork(self):
+        # The parent's watcher may have been mid-reload, holding the lock, when it forked
+        self._reload_lock = threading.Lock()
+        self.start_watcher()
+
+    def install_sighup_handler(self):
+        """
+        Reloads the catalog on SIGHUP. Does nothing on platforms without SIGHUP
+        or when called outside the main thread.
+        """
+        if not hasattr(signal, 'SIGHUP') or threading.current_thread() is not threading.main_thread():
+            return
+
+        def handle_sighup(signum, frame):
+            # Rebuild off the signal handler so it can't deadlock on the reload lock
+            threading.Thread(target=self.reload, kwargs={'force': True}, daemon=True).start()
+
+        signal.signal(signal.SIGHUP, handle_sighup)
+
+
+if __name__ == '__main__':
+    # Build through the imported module so the pickle refers to catalog.Catalog, not __main__.Catalog
+    import catalog
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    built = catalog.build_snapshot()
+    logging.info(f"Wrote catalog snapshot {_snapshot_path(built.version, SNAPSHOT_DIR)}")
@@ -0,0 +1,427 @@
+# ========================================================================
+#   Imports
+# ========================================================================
+
+import logging
+import mmap
+import os
+import struct
+from collections.abc import Mapping, Sequence
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Tuple
+
+import msgspec
+
+try:
+    import fcntl
+except ImportError:  # Not on Windows: there every process builds the files it needs itself
+    fcntl = None
+
+import caching
+import catalog as catalog_module
+import schemas
+from caching import CONTENT_ENCODINGS, MIN_COMPRESS_SIZE, LRUCache, source_digest, wait_for_compression
+from catalog import (
+    SNAPSHOT_DIR, Catalog, Leaderboard, SelectionIndex, build_snapshot, current_version, read_snapshot
+)
+from schemas import LeaderboardDetail
+
+
+# ========================================================================
+#   File Format
+# ========================================================================
+#
+# One read-only file per catalog version, mapped by every worker, so the page
+# cache holds a single copy however many processes there are:
+#
+#   header   magic + index length
+#   index    MessagePack CatalogIndex: version, questions, selection groups,
+#            node table and where each task's records and detail body live
+#   data     each task's Leaderboard records (MessagePack), then every distinct
+#            detail body with its gzip/brotli variants; offsets in the index
+#            are relative to the start of this section
+#
+# Only the index is decoded when the file is opened. A task's records are
+# decoded the first time a request touches that task, and detail bodies are
+# copied out of the map per response.
+
+MAGIC = b'LBCMAP01'
+HEADER = struct.Struct('<8sQ')
+
+# Hash of the code that writes the file and builds what's in it; files are keyed
+# on it as well as on the catalog version, so a code change rebuilds them
+MAPPED_CODE_VERSION = source_digest(__file__, catalog_module.__file__, schemas.__file__, caching.__file__)
+
+# Decoded objects each process keeps: tasks (with all their records) and detail entries
+DECODED_TASKS = int(os.environ.get('LEADERBOARD_MMAP_TASK_CACHE', '4'))
+DECODED_DETAILS = int(os.environ.get('LEADERBOARD_MMAP_DETAIL_CACHE', '256'))
+
+
+class Span(msgspec.Struct, array_like=True):
+    """Where a blob sits in the data section."""
+    offset: int
+    length: int
+
+
+class BodyRef(msgspec.Struct, array_like=True):
+    """A cached response body: its identity bytes plus any compressed variants."""
+    etag: str
+    mimetype: str
+    body: Span
+    variants: Dict[str, Span]
+
+
+class DetailRef(msgspec.Struct, array_like=True):
+    """The JSON and MessagePack bodies for one distinct leaderboard detail."""
+    json: BodyRef
+    msgpack: BodyRef
+
+
+class CatalogIndex(msgspec.Struct, array_like=True):
+    """Everything decoded up front when a mapped catalog is opened."""
+    version: str
+    questions: Dict[str, Any]
+    tasks: List[Tuple[str, Span]]
+    groups: List[Tuple[str, str]]
+    group_ends: List[int]
+    node_table: List[Tuple[str, Optional[str], Optional[str], Optional[str], Optional[str]]]
+    node_numbers: Dict[str, int]
+    details: Dict[str, int]
+    detail_refs: List[DetailRef]
+
+
+_index_decoder = msgspec.msgpack.Decoder(CatalogIndex)
+_goals_decoder = msgspec.msgpack.Decoder(Dict[str, Tuple[Leaderboard, ...]])
+_payload_decoder = msgspec.msgpack.Decoder(LeaderboardDetail)
+
+
+def _mapped_path(version, snapshot_dir):
+    return os.path.join(snapshot_dir, f'catalog-{version}-{MAPPED_CODE_VERSION}.mmap')
+
+
+# ========================================================================
+#   Writing
+# ========================================================================
+
+def write_mapped_catalog(catalog, snapshot_dir=SNAPSHOT_DIR):
+    """
+    Writes a built Catalog as a mappable file, replacing older versions' files.
+
+    A mapped file can't be filled in later, so this waits for the background
+    compressor to finish the detail bodies it has queued, and compresses any
+    that still have no variants (e.g. queued before a fork) itself.
+
+    Returns:
+        str: The file's path.
+    """
+    wait_for_compression()
+    data = bytearray()
+
+    def put(blob):
+        span = Span(offset=len(data), length=len(blob))
+        data.extend(blob)
+        return span
+
+    def put_body(cached):
+        if cached.compressible and not cached.variants:
+            cached.compress()
+        return BodyRef(
+            etag=cached.etag,
+            mimetype=cached.mimetype,
+            body=put(cached.body),
+            variants={coding: put(blob) for coding, blob in cached.variants.items()},
+        )
+
+    tasks = [(task, put(msgspec.msgpack.encode(goals))) for task, goals in catalog.recommendations.items()]
+
+    # Nodes that share a DetailEntry share its bodies in the file too
+    details = {}
+    detail_refs = []
+    numbers = {}
+    for node_id, entry in catalog.leaderboard_details.items():
+        number = numbers.get(id(entry))
+        if number is None:
+            number = numbers[id(entry)] = len(detail_refs)
+            detail_refs.append(DetailRef(json=put_body(entry.cached), msgpack=put_body(entry.cached_msgpack)))
+        details[node_id] = number
+
+    index = msgspec.msgpack.encode(CatalogIndex(
+        version=catalog.version,
+        questions=catalog.questions,
+        tasks=tasks,
+        groups=catalog.selection.groups,
+        group_ends=catalog.selection.group_ends,
+        node_table=catalog.node_table,
+        node_numbers=catalog.node_numbers,
+        details=details,
+        detail_refs=detail_refs,
+    ))
+
+    # Write to a temp file and rename so a worker never maps a half-written file
+    os.makedirs(snapshot_dir, exist_ok=True)
+    path = _mapped_path(catalog.version, snapshot_dir)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, len(index)))
+        f.write(index)
+        f.write(data)
+    os.replace(tmp_path, path)
+
+    # Workers still mapping an older version keep their mapping after the unlink
+    for name in os.listdir(snapshot_dir):
+        if name.startswith('catalog-') and name.endswith('.mmap') and name != os.path.basename(path):
+            try:
+                os.remove(os.path.join(snapshot_dir, name))
+            except OSError:
+                pass
+    return path
+
+
+# ========================================================================
+#   Mapped Catalog
+# ========================================================================
+
+class MappedBody:
+    """A CachedBody whose bytes stay in the mapped file until a response needs them."""
+
+    __slots__ = ('_catalog', '_ref')
+
+    def __init__(self, catalog, ref):
+        self._catalog = catalog
+        self._ref = ref
+
+    @property
+    def body(self):
+        return self._catalog.read(self._ref.body)
+
+    @property
+    def mimetype(self):
+        return self._ref.mimetype
+
+    @property
+    def etag(self):
+        return self._ref.etag
+
+    @property
+    def compressible(self):
+        return self._ref.body.length >= MIN_COMPRESS_SIZE
+
+    def select(self, accept_encodings):
+        """Same contract as CachedBody.select()."""
+        variants = self._ref.variants
+        best = accept_encodings.best_match([c for c in CONTENT_ENCODINGS if c in variants])
+        if best is None:
+            return None, self.body, self.etag
+        return best, self._catalog.read(variants[best]), f"{self.etag}-{best}"
+
+
+class MappedDetail:
+    """A DetailEntry backed by the mapped file; the payload is decoded only if asked for."""
+
+    __slots__ = ('cached', 'cached_msgpack')
+
+    def __init__(self, catalog, ref):
+        self.cached = MappedBody(catalog, ref.json)
+        self.cached_msgpack = MappedBody(catalog, ref.msgpack)
+
+    @property
+    def payload(self):
+        return _payload_decoder.decode(self.cached_msgpack.body)
+
+
+class _MappedRecommendations(Mapping):
+    # Task -> goal -> tuple of Leaderboard, decoding each task when it's first read
+    def __init__(self, catalog, tasks):
+        self._catalog = catalog
+        self._spans = dict(tasks)
+        self._decoded = LRUCache(maxsize=DECODED_TASKS, name='mmap-tasks')
+
+    def __getitem__(self, task):
+        span = self._spans[task]
+        return self._decoded.get_or_build(task, lambda: _goals_decoder.decode(self._catalog.view(span)))
+
+    def __iter__(self):
+        return iter(self._spans)
+
+    def __len__(self):
+        return len(self._spans)
+
+
+class _MappedDetails(Mapping):
+    # Node ID -> MappedDetail, built on first use and kept in a bounded cache
+    def __init__(self, catalog, details, detail_refs):
+        self._catalog = catalog
+        self._details = details
+        self._refs = detail_refs
+        self._decoded = LRUCache(maxsize=DECODED_DETAILS, name='mmap-details')
+
+    def __getitem__(self, node_id):
+        number = self._details[node_id]
+        return self._decoded.get_or_build(number, lambda: MappedDetail(self._catalog, self._refs[number]))
+
+    def __iter__(self):
+        return iter(self._details)
+
+    def __len__(self):
+        return len(self._details)
+
+
+class _MappedEntries(Sequence):
+    # SelectionIndex.entries, resolved from the group layout and the task's records on demand
+    def __init__(self, selection):
+        self._selection = selection
+
+    def _group_entries(self, group):
+        task, goal = self._selection.groups[group]
+        entries = [
+            (task, goal, lb, benchmark)
+            for lb in self._selection.recommendations[task][goal]
+            for benchmark in lb.benchmarks or (None,)
+        ]
+        return entries or [(task, goal, None, None)]
+
+    def __getitem__(self, position):
+        if not 0 <= position < len(self):
+            raise IndexError(position)
+        group = self._selection.entry_groups[position]
+        start = self._selection.group_ends[group - 1] if group else 0
+        return self._group_entries(group)[position - start]
+
+    def __iter__(self):
+        for group in range(len(self._selection.groups)):
+            yield from self._group_entries(group)
+
+    def __len__(self):
+        return self._selection.group_ends[-1] if self._selection.group_ends else 0
+
+
+def _mapped_selection_index(recommendations, groups, group_ends):
+    # Rebuilds the bitsets from the stored group layout without decoding any records
+    selection = SelectionIndex.__new__(SelectionIndex)
+    selection.recommendations = recommendations
+    selection.groups = [tuple(group) for group in groups]
+    selection.group_ends = list(group_ends)
+    selection.entry_groups = []
+    selection.task_bits = {}
+    selection.goal_bits = {}
+
+    start = 0
+    for group, ((task, goal), end) in enumerate(zip(selection.groups, selection.group_ends)):
+        selection.entry_groups.extend([group] * (end - start))
+        bits = ((1 << (end - start)) - 1) << start
+        selection.task_bits[task] = selection.task_bits.get(task, 0) | bits
+        selection.goal_bits[goal] = selection.goal_bits.get(goal, 0) | bits
+        start = end
+
+    selection.all_bits = (1 << start) - 1
+    selection.entries = _MappedEntries(selection)
+    return selection
+
+
+class MappedCatalog(Catalog):
+    """
+    A Catalog read from a memory-mapped file instead of built in this process.
+
+    Offers the same attributes and methods as Catalog. The file's pages are
+    shared by every process that maps it; each process only holds the small
+    index plus the bounded caches of tasks and details it has decoded.
+
+    Args:
+        path (str): A file written by write_mapped_catalog().
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, index_length = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a mapped catalog")
+        self._data_start = HEADER.size + index_length
+        index = _index_decoder.decode(memoryview(self._map)[HEADER.size:self._data_start])
+
+        self.questions = index.questions
+        self.version = index.version
+        self.sources = ()
+        self.detail_entries = {}
+        self.node_table = index.node_table
+        self.node_numbers = index.node_numbers
+        self.recommendations = _MappedRecommendations(self, index.tasks)
+        self.leaderboard_details = _MappedDetails(self, index.details, index.detail_refs)
+        self.selection = _mapped_selection_index(self.recommendations, index.groups, index.group_ends)
+
+    @property
+    def decoded_caches(self):
+        """The per-process caches of decoded tasks and details, for reporting their stats."""
+        return [self.recommendations._decoded, self.leaderboard_details._decoded]
+
+    def view(self, span):
+        """A zero-copy view of a blob in the data section."""
+        start = self._data_start + span.offset
+        return memoryview(self._map)[start:start + span.length]
+
+    def read(self, span):
+        """A blob from the data section, copied out as bytes."""
+        start = self._data_start + span.offset
+        return self._map[start:start + span.length]
+
+
+def map_catalog(catalog, snapshot_dir=SNAPSHOT_DIR):
+    """Writes catalog as a mapped file (unless one exists for its version) and maps it."""
+    path = _mapped_path(catalog.version, snapshot_dir)
+    if not os.path.exists(path):
+        write_mapped_catalog(catalog, snapshot_dir)
+    return MappedCatalog(path)
+
+
+def open_mapped_file(version, snapshot_dir=SNAPSHOT_DIR):
+    """Maps the existing file for version, or returns None if it's missing or unreadable."""
+    try:
+        return MappedCatalog(_mapped_path(version, snapshot_dir))
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logging.warning(f"Ignoring unreadable mapped catalog: {str(e)}")
+        return None
+
+
+@contextmanager
+def build_lock(snapshot_dir=SNAPSHOT_DIR):
+    """
+    Holds an exclusive lock, across processes, while one process builds a version's
+    files. The others wait for it, then map what it wrote instead of parsing,
+    compressing and writing the same files themselves.
+    """
+    if fcntl is None:
+        yield
+        return
+    os.makedirs(snapshot_dir, exist_ok=True)
+    with open(os.path.join(snapshot_dir, 'build.lock'), 'wb') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def open_mapped_catalog(directory, snapshot_dir=SNAPSHOT_DIR):
+    """
+    Maps the file for the catalog files' current version, building it first (from
+    the pickled snapshot if there is one, else from the files, writing the
+    snapshot too) if it's missing or unreadable. The pickled snapshot is what
+    CatalogStore reloads incrementally from.
+    """
+    version = current_version(directory)
+    mapped = open_mapped_file(version, snapshot_dir)
+    if mapped is not None:
+        return mapped
+
+    with build_lock(snapshot_dir):
+        # Another process may have built it while this one waited for the lock
+        mapped = open_mapped_file(version, snapshot_dir)
+        if mapped is not None:
+            return mapped
+        catalog = read_snapshot(version, snapshot_dir) or build_snapshot(directory, snapshot_dir)
+        write_mapped_catalog(catalog, snapshot_dir)
+    return MappedCatalog(_mapped_path(catalog.version, snapshot_dir))
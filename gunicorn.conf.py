@@ -0,0 +1,70 @@
+# ========================================================================
+#   Gunicorn Configuration
+# ========================================================================
+#
+# Usage: gunicorn -c gunicorn.conf.py
+#
+# With preloading on (the default), the master process imports app and calls
+# create_app(), which loads the catalog and warms the caches, then forks the
+# workers. Everything built before the fork is shared copy-on-write, and
+# gc.freeze() moves it out of the collector's reach, so the cyclic GC never
+# touches (and copies) those pages in the workers. Reference count updates
+# still dirty the pages of the objects a request touches.
+#
+# LEADERBOARD_PRELOAD=0 makes each worker load everything on its own instead,
+# and LEADERBOARD_GC_FREEZE=0 preloads without freezing (for comparison).
+#
+# Gunicorn takes over SIGHUP in the master (and resets it in the workers), so
+# the catalog's own SIGHUP handler never runs here. `kill -HUP <master>` still
+# forces a reload: the on_reload hook below rebuilds the catalog in the master
+# before gunicorn replaces the workers, which fork from the new one.
+
+import gc
+import os
+
+
+# ========================================================================
+#   Server
+# ========================================================================
+
+bind = os.environ.get('LEADERBOARD_BIND', '127.0.0.1:8000')
+workers = int(os.environ.get('LEADERBOARD_WORKERS', '4'))
+wsgi_app = 'app:create_app()'
+preload_app = os.environ.get('LEADERBOARD_PRELOAD', '1') == '1'
+gc_freeze = os.environ.get('LEADERBOARD_GC_FREEZE', '1') == '1'
+
+
+# ========================================================================
+#   Garbage Collection Around Fork
+# ========================================================================
+
+if preload_app:
+    # Keep the collector from running (and writing to object headers) while the
+    # master builds the shared state; this file is read before the app is loaded
+    gc.disable()
+
+
+def pre_fork(server, worker):
+    # Runs in the master right before each fork
+    if preload_app:
+        if gc_freeze:
+            # Everything alive now goes to the permanent generation, which is never collected
+            gc.freeze()
+        # The master keeps running the catalog watcher and compressor, so it needs
+        # the collector back for what reloads build (and the garbage they leave);
+        # workers inherit it enabled
+        gc.enable()
+
+
+# ========================================================================
+#   Reloading
+# ========================================================================
+
+def on_reload(server):
+    # Runs in the master on SIGHUP, before the old workers are replaced
+    if preload_app:
+        import app
+        app.catalog_store.reload(force=True)
+        # Warm the new version too, so the replacement workers share it like the first ones
+        app.warm_caches()
+    # Without preloading each new worker loads the current files itself
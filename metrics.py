@@ -0,0 +1,151 @@
+# ========================================================================
+#   Imports
+# ========================================================================
+
+import math
+import threading
+
+from timing import DEFAULT_BUCKETS, HistogramSet
+
+
+# ========================================================================
+#   Metric Types
+# ========================================================================
+#
+# A minimal Prometheus client: counters and histograms updated on the request
+# path (a lock and an add each), plus callbacks that read values other parts of
+# the app already keep (cache counters, the catalog) when /metrics is scraped.
+# Each process keeps its own values, so under gunicorn every worker reports
+# the requests it served.
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class Counter:
+    """
+    A monotonically increasing count per label tuple.
+
+    Args:
+        name (str): Metric name, ending in _total by convention.
+        documentation (str): HELP text.
+        labelnames (tuple): Names of the labels passed to inc().
+    """
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def collect(self):
+        with self._lock:
+            values = sorted(self._values.items())
+        samples = [(self.name, dict(zip(self.labelnames, labels)), value) for labels, value in values]
+        return [(self.name, 'counter', self.documentation, samples)]
+
+
+class HistogramMetric:
+    """
+    A timing.Histogram per label tuple, exposed as a Prometheus histogram.
+
+    Args:
+        name (str): Metric name.
+        documentation (str): HELP text.
+        labelnames (tuple): Names of the labels passed to observe().
+        buckets (tuple): Bucket upper bounds.
+        histograms (HistogramSet): An existing set to expose instead of a new one.
+    """
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS, histograms=None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.histograms = histograms if histograms is not None else HistogramSet(buckets)
+
+    def observe(self, value, *labels):
+        self.histograms.get(*labels).observe(value)
+
+    def collect(self):
+        samples = []
+        for labels, histogram in self.histograms.items():
+            label_dict = dict(zip(self.labelnames, labels))
+            for bound, running in histogram.cumulative():
+                samples.append((f'{self.name}_bucket', {**label_dict, 'le': bound}, running))
+            samples.append((f'{self.name}_sum', label_dict, histogram.sum))
+            samples.append((f'{self.name}_count', label_dict, histogram.count))
+        return [(self.name, 'histogram', self.documentation, samples)]
+
+
+class CallbackMetric:
+    """
+    A metric whose values are read when it's scraped.
+
+    Args:
+        name (str): Metric name.
+        documentation (str): HELP text.
+        metric_type (str): 'gauge' or 'counter'.
+        labelnames (tuple): Label names, in the order read() returns them.
+        read (callable): Returns [(labels tuple, value), ...].
+    """
+
+    def __init__(self, name, documentation, metric_type, labelnames, read):
+        self.name = name
+        self.documentation = documentation
+        self.metric_type = metric_type
+        self.labelnames = tuple(labelnames)
+        self.read = read
+
+    def collect(self):
+        samples = [(self.name, dict(zip(self.labelnames, labels)), value) for labels, value in self.read()]
+        return [(self.name, self.metric_type, self.documentation, samples)]
+
+
+# ========================================================================
+#   Exposition
+# ========================================================================
+
+def _format_value(value):
+    if isinstance(value, float):
+        if math.isinf(value):
+            return '+Inf' if value > 0 else '-Inf'
+        if math.isnan(value):
+            return 'NaN'
+        return repr(value)
+    return str(value)
+
+
+def _escape_label(value):
+    return str(value).replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"')
+
+
+class Registry:
+    """The metrics served at /metrics, rendered in registration order."""
+
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self):
+        """Renders every metric in the Prometheus text exposition format (0.0.4)."""
+        lines = []
+        for metric in self._metrics:
+            for name, metric_type, documentation, samples in metric.collect():
+                lines.append(f'# HELP {name} {documentation}')
+                lines.append(f'# TYPE {name} {metric_type}')
+                for sample_name, labels, value in samples:
+                    if labels:
+                        label_text = ','.join(
+                            f'{key}="{_escape_label(_format_value(label))}"' for key, label in labels.items()
+                        )
+                        lines.append(f'{sample_name}{{{label_text}}} {_format_value(value)}')
+                    else:
+                        lines.append(f'{sample_name} {_format_value(value)}')
+        return '\n'.join(lines) + '\n'
@@ -3,145 +3,468 @@
 # ======================================================================== 
 
 import json
-from pyvis.network import Network
+import logging
+import math
+import os
+import threading
+import catalog as catalog_module
+from caching import CachedBody, source_digest
+from catalog import make_node_id, parse_node_id
+from schemas import JSON_MIMETYPE, MSGPACK_MIMETYPE, Edge, Graph, Node, encode
+from timing import stage
+
+
+# ========================================================================
+#   Build Selection Results
+# ======================================================================== 
+
+class SelectionResult:
+    """
+    Everything the graph needs for one task/goal selection, built once and cached.
+
+    Attributes:
+        filtered_recs (dict): Recommendations filtered to the selection.
+        network_data (Graph): vis.js nodes and edges.
+        network_json (str): network_data serialized for the template.
+        graph (CachedBody): network_json as the /api/graph response body.
+        graph_msgpack (CachedBody): The same graph as MessagePack.
+        node_ids (dict): Node ID -> node, for computing graph deltas.
+        edge_ids (dict): Edge ID -> edge, for computing graph deltas.
+    """
+
+    def __init__(self, filtered_recs, network_data):
+        self.filtered_recs = filtered_recs
+        self.network_data = network_data
+        self.graph = CachedBody(encode(network_data), JSON_MIMETYPE)
+        self.graph_msgpack = CachedBody(encode(network_data, MSGPACK_MIMETYPE), MSGPACK_MIMETYPE)
+        self.network_json = self.graph.body.decode('utf-8')
+        self.node_ids = {node.id: node for node in network_data.nodes}
+        self.edge_ids = {edge.id: edge for edge in network_data.edges}
+
+
+def build_selection(catalog, tasks, goals):
+    """
+    Builds the SelectionResult for a canonical (tasks, goals) selection.
+
+    Raises:
+        ValueError: If the selection matches nothing, so there's no graph to draw.
+    """
+    # Resolve the selection with the catalog's bitset index
+    # (no tasks or no goals selected means that dimension isn't filtered)
+    with stage('select'):
+        filtered_recs = catalog.selection.select(tasks, goals)
+
+    # Build the nodes and edges for vis.js
+    with stage('network'):
+        network_data = build_network(filtered_recs)
+    
+    # If network_data is None, filtered_recs was empty
+    if network_data is None:
+        raise ValueError("Network returned by build_network is None. filtered_recs might be empty.")
+
+    # Place the nodes here so the browser can skip its physics stabilization.
+    # Positions are cached per node, so they stay put as the selection changes.
+    with stage('layout'):
+        layout_cache.apply(catalog, network_data)
+
+    # Swap the long string IDs for the catalog's dense integer IDs to shrink the payload
+    with stage('number'):
+        number_nodes(catalog, network_data)
+
+    # Serialize the graph (JSON and MessagePack) once for every later response
+    with stage('serialize'):
+        return SelectionResult(filtered_recs, network_data)
+
+
+def graph_delta(previous, current):
+    """
+    Returns the node and edge changes that turn one selection's graph into another's.
+
+    Within a catalog version a node ID always maps to the same node, so nodes present
+    in both graphs only show up again (as {'id', 'x', 'y'}) if the layout moved them.
+    """
+    moved = []
+    for node_id, node in current.node_ids.items():
+        old = previous.node_ids.get(node_id)
+        if old is not None and (old.x, old.y) != (node.x, node.y):
+            moved.append({'id': node_id, 'x': node.x, 'y': node.y})
+
+    return {
+        'nodes_added': [node for node_id, node in current.node_ids.items() if node_id not in previous.node_ids],
+        'nodes_removed': [node_id for node_id in previous.node_ids if node_id not in current.node_ids],
+        'nodes_moved': moved,
+        'edges_added': [edge for edge_id, edge in current.edge_ids.items() if edge_id not in previous.edge_ids],
+        'edges_removed': [edge_id for edge_id in previous.edge_ids if edge_id not in current.edge_ids],
+    }
+
+
+def number_nodes(catalog, network_data):
+    """
+    Replaces string node IDs (and edge IDs/endpoints) with the catalog's integer IDs.
+    catalog.node_table maps them back to (task, goal, leaderboard, benchmark).
+    """
+    numbers = catalog.node_numbers
+    for node in network_data.nodes:
+        node.id = numbers[node.id]
+    for edge in network_data.edges:
+        edge.id = numbers[edge.id]
+        edge.from_ = numbers[edge.from_]
+        edge.to = numbers[edge.to]
+    return network_data
+
+
+# ========================================================================
+#   Benchmark Rows (Columnar)
+# ======================================================================== 
+
+# Columns of the benchmark table, one row per benchmark
+ROW_COLUMNS = ('Task', 'Goal', 'Leaderboard', 'Tips', 'Source', 'Tooltip', 'Methodology')
+
+# Columns the ?q= search looks in
+ROW_SEARCH_COLUMNS = ('Leaderboard', 'Tips')
+
+
+class RowTable:
+    """
+    The benchmark table for one catalog version, stored column by column.
+
+    Each column is a list of indexes into a shared string table, so the long
+    Tips/Source/Tooltip strings repeated across a leaderboard's benchmarks are
+    stored once. Rows are in catalog order and remember their position in the
+    catalog's SelectionIndex, so task/goal filtering reuses the same bitsets.
+    """
+
+    def __init__(self, catalog):
+        self.strings = []
+        self.columns = {name: [] for name in ROW_COLUMNS}
+        self.entry_positions = []
+        self._string_ids = {}
+        self._sort_orders = {}
+
+        for position, (task, goal, lb, benchmark) in enumerate(catalog.selection.entries):
+            # Placeholder entries (leaderboards without benchmarks) don't get rows
+            if benchmark is None:
+                continue
+            values = (
+                task,
+                goal,
+                lb.name,
+                "\n".join(lb.analysis_tips),
+                lb.link.url,
+                lb.tooltip,
+                lb.methodology.url,
+            )
+            for name, value in zip(ROW_COLUMNS, values):
+                self.columns[name].append(self._intern(value))
+            self.entry_positions.append(position)
+
+    def _intern(self, value):
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = self._string_ids[value] = len(self.strings)
+            self.strings.append(value)
+        return string_id
+
+    def sort_order(self, column, descending=False):
+        """Row indexes sorted (stably, case-insensitively) by a column; computed once per column."""
+        key = (column, descending)
+        order = self._sort_orders.get(key)
+        if order is None:
+            values = self.columns[column]
+            order = sorted(
+                range(len(values)),
+                key=lambda row: self.strings[values[row]].casefold(),
+                reverse=descending
+            )
+            self._sort_orders[key] = order
+        return order
+
+    def query(self, mask, search=None, sort=None, descending=False):
+        """
+        Returns the row indexes matching a selection mask (from SelectionIndex.mask)
+        and an optional case-insensitive search, in the requested sort order.
+        """
+        order = self.sort_order(sort, descending) if sort else range(len(self.entry_positions))
+        bits = bin(mask)[:1:-1]
+        rows = [
+            row for row in order
+            if self.entry_positions[row] < len(bits) and bits[self.entry_positions[row]] == '1'
+        ]
+
+        if search:
+            needle = search.casefold()
+            searched = [self.columns[name] for name in ROW_SEARCH_COLUMNS]
+            rows = [
+                row for row in rows
+                if any(needle in self.strings[column[row]].casefold() for column in searched)
+            ]
+        return rows
+
+    def encode_page(self, rows):
+        """
+        Encodes rows as column arrays plus a page-local string table:
+        {"columns": [...], "strings": [...], "data": {column: [string index, ...]}}
+        """
+        local_ids = {}
+        strings = []
+        data = {}
+        for name in ROW_COLUMNS:
+            column = self.columns[name]
+            encoded = []
+            for row in rows:
+                string_id = column[row]
+                local_id = local_ids.get(string_id)
+                if local_id is None:
+                    local_id = local_ids[string_id] = len(strings)
+                    strings.append(self.strings[string_id])
+                encoded.append(local_id)
+            data[name] = encoded
+        return {'columns': list(ROW_COLUMNS), 'strings': strings, 'data': data}
 
 
 # ========================================================================
 #   Build Default Network Graph Structure
 # ======================================================================== 
 
+# Node styling lives in the vis-network `groups` option (see static/js/network.js),
+# so each node only carries its group name instead of its own color, size and font.
+# Edge styling comes from the `edges` option the same way.
+
 def build_network(recommendations):
-    # print(f"Building network with recommendations: {len(recommendations)} tasks")
+    """
+    Builds the vis.js graph (start -> task -> goal -> leaderboard -> benchmark).
+
+    Returns:
+        Graph: The nodes and edges, or None if recommendations is empty.
+    """
     if not recommendations:
         print("Warning: Empty recommendations provided")
-        return None  # or handle appropriately
+        return None
 
-    # Adjust height of network graph here
-    net = Network(directed=False)
+    nodes = []
+    edges = []
+    added = set()
 
-    # Define a common font style
-    label_font = {
-        'size': 30,
-        'color': '#333333',
-        'face': 'Ek Mukta',
-        'background': 'rgba(255, 255, 255, 0.8)'
-    }
+    def add_node(node_id, parent_id, label, group, title=None):
+        # Keep track of what we've added to avoid duplicates
+        if node_id in added:
+            return
+        added.add(node_id)
+        nodes.append(Node(id=node_id, label=label, group=group, title=title))
+
+        # The graph is a tree, so each edge is identified by the node it leads to.
+        # Stable edge IDs let the front end remove edges when applying graph deltas.
+        if parent_id is not None:
+            edges.append(Edge(id=node_id, from_=parent_id, to=node_id))
 
     # Add the "Start here" node
-    net.add_node(
-        'start',
-        label='Start here',
-        # title='Start here',
-        color='#E90555',
-        size=70,
-        font=label_font
-    )
-
-    # Keep track of what we've added to avoid duplicates
-    added_tasks = set()
-    added_goals = set()
-    added_leaderboards = set()
+    add_node('start', None, label='Start here', group='start')
 
     # Build the network from the dictionary
     for task, goals_dict in recommendations.items():
         # Add task node
-        if task not in added_tasks:
-            net.add_node(
-                f'task_{task}',
-                label=task,
-                title=f"Task: {task}",
-                color='#ffa500',                                       # Orange
-                size=60,
-                font=label_font
-            )
-            added_tasks.add(task)
-            net.add_edge('start', f'task_{task}', color='#999')
+        task_id = make_node_id('task', task)
+        add_node(task_id, 'start', label=task, title=f"Task: {task}", group='task')
 
         # Add goals under each task
         for goal, leaderboards in goals_dict.items():
-            goal_id = f'goal_{task}_{goal}'
-            if goal_id not in added_goals:
-                net.add_node(
-                    goal_id,
-                    label=goal,
-                    title=f"Benchmark to compare: {goal}",
-                    color='#0273be',                                    # Blue
-                    size=50,
-                    font=label_font
-                )
-                added_goals.add(goal_id)
-                net.add_edge(f'task_{task}', goal_id, color='#999')
+            goal_id = make_node_id('goal', task, goal)
+            add_node(goal_id, task_id, label=goal, title=f"Benchmark to compare: {goal}", group='goal')
 
             # Add leaderboards under each goal
-            for lb_data in leaderboards:
-                lb_name = lb_data["leaderboard"]                        # Full name
-                lb_label = lb_data.get("leaderboard_abbrev", lb_name)   # Label
+            for lb in leaderboards:
+                lb_name = lb.name
 
                 # Construct the custom title (tooltip) string
                 lb_title = (
                     f"Leaderboard: {lb_name}\n\n"
-                    f"Overview: {lb_data.get('tooltip', '')}\n\n"
+                    f"Overview: {lb.tooltip}\n\n"
                     f"Learn more: Select the node (dot) to learn more about this leaderboard."
                 )
 
-                lb_id = f'leaderboard_{task}_{goal}_{lb_name}'
-                if lb_id not in added_leaderboards:
-                    net.add_node(
-                        lb_id,
-                        label=lb_label,
-                        title=lb_title,                                 # The two-line format
-                        color='#8bb42d',
-                        size=40,
-
-                        # data: store the entire dictionary if you need it for your modal
-                        data={
-                            'type': 'leaderboard',
-                            'leaderboard_info': lb_data
-                        },
-
-                        font={
-                            'size': 20,
-                            'color': '#333',
-                            'face': 'Ek Mukta',
-                            'background': 'rgba(255, 255, 255, 0.8)'
-                        }
-                    )
-                    added_leaderboards.add(lb_id)
-                    net.add_edge(goal_id, lb_id, color='#999')
+                # Details for the modal are fetched on demand from /api/leaderboards
+                lb_id = make_node_id('leaderboard', task, goal, lb_name)
+                add_node(lb_id, goal_id, label=lb.abbrev, title=lb_title, group='leaderboard')
 
                 # Add benchmark nodes
-                benchmarks = lb_data.get('benchmarks', [])
-                for benchmark in benchmarks:
-                    
-                    # NEW: Extract the benchmark name to use as label
-                    benchmark_name = benchmark.get('benchmark_name', 'Unknown Benchmark')  # Using get() to avoid errors if key doesn't exist
-                    
-                    # NEW: Extract measures for the tooltip/title
-                    benchmark_measures = benchmark.get('benchmark_measures', '')
-
-                    # NEW: Adjusting the benchmark_id to include benchmark_name
-                    # Replace spaces in benchmark_name with underscores to avoid ID issues
-                    benchmark_id = f"benchmark_{task}_{goal}_{lb_name}_{benchmark_name.replace(' ', '_')}"
-                    
+                for benchmark in lb.benchmarks:
+                    benchmark_name = benchmark.name
                     benchmark_title = (
-                                        f"Benchmark: {benchmark_name}\n\n"
-                                        f"Measures: {benchmark_measures}"
-                                      )
-
-                    # NEW: Use benchmark_name for label, benchmark_measures for title
-                    net.add_node(
-                        benchmark_id,
-                        label=benchmark_name,               
-                        title=benchmark_title,                          # Formatted title (tooltip)
-                        color='#999999',
-                        size=30,
-                        font={
-                            'size': 18,
-                            'color': '#333',
-                            'face': 'Ek Mukta',
-                            'background': 'rgba(255, 255, 255, 0.8)'
-                        }
+                        f"Benchmark: {benchmark_name}\n\n"
+                        f"Measures: {benchmark.measures}"
                     )
-                    net.add_edge(lb_id, benchmark_id, color='#999999')
 
-    return net
\ No newline at end of file
+                    benchmark_id = make_node_id('benchmark', task, goal, lb_name, benchmark_name)
+                    add_node(benchmark_id, lb_id, label=benchmark_name, title=benchmark_title, group='benchmark')
+
+    return Graph(nodes=nodes, edges=edges)
+
+
+# ========================================================================
+#   Radial Tree Layout
+# ======================================================================== 
+
+# Radius of each ring: start, task, goal, leaderboard, benchmark
+RING_RADII = (0, 450, 900, 1400, 1900)
+
+# Minimum distance between neighboring nodes on the outer ring
+MIN_LEAF_SPACING = 90
+
+# Where laid-out positions are persisted, one JSON file per catalog version
+LAYOUT_CACHE_DIR = os.environ.get(
+    'LEADERBOARD_LAYOUT_CACHE',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.layout_cache')
+)
+
+# The layout code (this module) and node IDs (catalog) are part of the key, so changing either re-lays out
+LAYOUT_CODE_VERSION = source_digest(__file__, catalog_module.__file__)
+
+
+def _place_subtree(root_id, children, leaves, start, end, depth, scale, positions):
+    """
+    Radially places root_id and everything below it within the slice [start, end).
+
+    Each node gets a share of its parent's slice proportional to the number of
+    leaves under it and sits in the middle of that share, on the ring for its depth.
+    """
+    stack = [(root_id, start, end, depth)]
+    while stack:
+        node_id, start, end, depth = stack.pop()
+
+        radius = RING_RADII[min(depth, len(RING_RADII) - 1)] * scale
+        angle = (start + end) / 2
+        positions[node_id] = (round(radius * math.cos(angle)), round(radius * math.sin(angle)))
+
+        per_leaf = (end - start) / leaves[node_id]
+        for kid in children.get(node_id, ()):
+            kid_end = start + per_leaf * leaves[kid]
+            stack.append((kid, start, kid_end, depth + 1))
+            start = kid_end
+
+
+class CatalogTree:
+    """
+    The full catalog graph's shape, used to give every task a fixed slice of the circle.
+
+    Slices are sized from the whole catalog rather than the current selection, so a
+    node lands in the same place no matter which other tasks and goals are selected.
+    """
+
+    def __init__(self, catalog):
+        network_data = build_network(catalog.recommendations) or Graph(nodes=[], edges=[])
+
+        self.children = {}
+        for edge in network_data.edges:
+            self.children.setdefault(edge.from_, []).append(edge.to)
+
+        # Nodes are emitted parents-first, so walking them backwards counts leaves bottom-up
+        self.leaves = {}
+        for node in reversed(network_data.nodes):
+            kids = self.children.get(node.id)
+            self.leaves[node.id] = sum(self.leaves[kid] for kid in kids) if kids else 1
+
+        # Grow the rings when there are too many leaves to fit on the outer one
+        total = self.leaves.get('start', 1)
+        self.scale = max(1.0, total * MIN_LEAF_SPACING / (2 * math.pi * RING_RADII[-1]))
+
+        # Each task's slice of the circle
+        self.task_slices = {}
+        start = 0.0
+        per_leaf = 2 * math.pi / total
+        for task_id in self.children.get('start', ()):
+            end = start + per_leaf * self.leaves[task_id]
+            self.task_slices[task_id] = (start, end)
+            start = end
+
+    def place_task(self, task_id, positions):
+        """Places a task node and its whole subtree into positions."""
+        start, end = self.task_slices[task_id]
+        _place_subtree(task_id, self.children, self.leaves, start, end, 1, self.scale, positions)
+
+
+class LayoutCache:
+    """
+    Remembers node positions per (catalog version, node ID) and persists them to disk.
+
+    A node that has been placed once keeps its coordinates across selections and
+    process restarts. Nodes that haven't been placed yet are laid out a task
+    subtree at a time, so a repeat or overlapping selection is just dict lookups.
+
+    Args:
+        directory (str): Where to keep the layout-<version>.json files.
+    """
+
+    def __init__(self, directory=LAYOUT_CACHE_DIR):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._positions = {}     # version -> {node_id: (x, y)}
+        self._trees = {}         # version -> CatalogTree
+        self._lock = threading.Lock()
+
+    def _path(self, version):
+        return os.path.join(self.directory, f'layout-{version}-{LAYOUT_CODE_VERSION}.json')
+
+    def _load(self, version):
+        try:
+            with open(self._path(version), 'r') as f:
+                return {node_id: tuple(xy) for node_id, xy in json.load(f).items()}
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, version, positions):
+        # Write to a temp file and rename so a crash never leaves a half-written cache
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = f'{self._path(version)}.{os.getpid()}.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(positions, f, separators=(',', ':'))
+            os.replace(tmp_path, self._path(version))
+
+            # Only the current version's layout is ever read again
+            current = os.path.basename(self._path(version))
+            for name in os.listdir(self.directory):
+                if name.startswith('layout-') and name.endswith('.json') and name != current:
+                    os.remove(os.path.join(self.directory, name))
+        except OSError as e:
+            logging.warning(f"Could not persist layout cache: {str(e)}")
+
+    def _positions_for(self, version):
+        positions = self._positions.get(version)
+        if positions is None:
+            # Only the current catalog version is worth keeping in memory
+            self._positions = {version: self._load(version)}
+            self._trees = {}
+            positions = self._positions[version]
+        return positions
+
+    def apply(self, catalog, network_data):
+        """Sets x/y on every node in network_data, placing any nodes seen for the first time."""
+        with self._lock:
+            positions = self._positions_for(catalog.version)
+
+            missing = [node.id for node in network_data.nodes if node.id not in positions]
+            self.hits += len(network_data.nodes) - len(missing)
+            self.misses += len(missing)
+
+            if missing:
+                tree = self._trees.get(catalog.version)
+                if tree is None:
+                    tree = self._trees[catalog.version] = CatalogTree(catalog)
+
+                positions['start'] = (0, 0)
+                for node_id in missing:
+                    if node_id in positions:
+                        continue
+                    kind, parts = parse_node_id(node_id)
+                    if kind != 'start':
+                        tree.place_task(make_node_id('task', parts[0]), positions)
+                self._save(catalog.version, positions)
+
+        for node in network_data.nodes:
+            node.x, node.y = positions[node.id]
+        return network_data
+
+
+# Node positions shared by every selection
+layout_cache = LayoutCache()
@@ -0,0 +1,77 @@
+# ========================================================================
+#   Imports
+# ========================================================================
+
+from typing import Dict, List, Optional, Union
+
+import msgspec
+
+
+# ========================================================================
+#   Graph Payloads
+# ========================================================================
+
+# Node IDs start out as canonical strings and become integers once numbered
+NodeId = Union[int, str]
+
+
+class Node(msgspec.Struct, omit_defaults=True):
+    """A vis.js node. Styling comes from its group; unset fields are left out of the payload."""
+    id: NodeId
+    label: str
+    group: str
+    title: Optional[str] = None
+    x: Optional[int] = None
+    y: Optional[int] = None
+
+
+class Edge(msgspec.Struct):
+    """A vis.js edge, identified by the node it leads to."""
+    id: NodeId
+    from_: NodeId = msgspec.field(name='from')
+    to: NodeId
+
+
+class Graph(msgspec.Struct):
+    """The nodes and edges for one selection."""
+    nodes: List[Node]
+    edges: List[Edge]
+
+
+# ========================================================================
+#   Leaderboard Detail Payloads
+# ========================================================================
+
+class BenchmarkDetail(msgspec.Struct):
+    """One benchmark as shown in the leaderboard modal."""
+    measures: str
+    score_interpretation: str
+
+
+class LeaderboardDetail(msgspec.Struct):
+    """Everything the leaderboard modal renders for one leaderboard."""
+    leaderboard: str
+    tooltip: str
+    analysis_tips: List[str]
+    benchmarks: Dict[str, BenchmarkDetail]
+    leaderboard_link: str
+    methodology_url: str
+
+
+# ========================================================================
+#   Encoders
+# ========================================================================
+
+JSON_MIMETYPE = 'application/json'
+MSGPACK_MIMETYPE = 'application/msgpack'
+
+# Encoders are reusable and thread-safe, so one of each is shared
+json_encoder = msgspec.json.Encoder()
+msgpack_encoder = msgspec.msgpack.Encoder()
+
+
+def encode(obj, mimetype=JSON_MIMETYPE):
+    """Encodes obj (Structs, dicts, lists...) as JSON or MessagePack bytes."""
+    if mimetype == MSGPACK_MIMETYPE:
+        return msgpack_encoder.encode(obj)
+    return json_encoder.encode(obj)
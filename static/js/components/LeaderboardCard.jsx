@@ -13,7 +13,7 @@ const LeaderboardCard = () => {
           headers: {
             'Content-Type': 'application/json'
           },
-          body: JSON.stringify({ node_id: event.detail.nodeId })
+          body: JSON.stringify({ node_id: event.detail.nodeId, version: window.dataVersion })
         });
         const data = await response.json();
         setLeaderboardData(data);
@@ -12,7 +12,7 @@ const LeaderboardCard = () => {
         const response = await fetch('/filter_data', {
           method: 'POST',
           headers: { 'Content-Type': 'application/json' },
-          body: JSON.stringify({ node_id: event.detail.nodeId })
+          body: JSON.stringify({ node_id: event.detail.nodeId, version: window.dataVersion })
         });
         const responseData = await response.json();
         setData(responseData);
@@ -5,6 +5,29 @@
 // Initialize network object at global scope
 var network = null;
 
+// Shared node styling; each node from the server only names its group
+const GROUP_LABEL_FONT = {
+    size: 30,
+    color: '#333333',
+    face: 'Ek Mukta',
+    background: 'rgba(255, 255, 255, 0.8)'
+};
+
+const NODE_GROUPS = {
+    start: { color: '#E90555', size: 70, font: GROUP_LABEL_FONT },
+    task: { color: '#ffa500', size: 60, font: GROUP_LABEL_FONT },                       // Orange
+    goal: { color: '#0273be', size: 50, font: GROUP_LABEL_FONT },                       // Blue
+    leaderboard: { color: '#8bb42d', size: 40, font: Object.assign({}, GROUP_LABEL_FONT, { size: 20, color: '#333' }) },
+    benchmark: { color: '#999999', size: 30, font: Object.assign({}, GROUP_LABEL_FONT, { size: 18, color: '#333' }) }
+};
+
+// DataSets backing the graph, swapped in place when the selection changes
+var nodesDataSet = null;
+var edgesDataSet = null;
+
+// Leaderboard details prefetched for the current graph, keyed by String(node ID)
+window.leaderboardDetails = new Map();
+
 // Update canvas size to match container
 function resizeCanvas() {
     const container = document.getElementById('network-container');
@@ -50,11 +73,14 @@ function initializeNetwork() {
         const zoomLevel = $('#node-spacing-slider').val() || 1;
         const networkData = window.networkData || { nodes: [], edges: [] };
 
+        nodesDataSet = new vis.DataSet(networkData.nodes);
+        edgesDataSet = new vis.DataSet(networkData.edges);
+
         network = new vis.Network(
             container,
             {
-                nodes: new vis.DataSet(networkData.nodes),
-                edges: new vis.DataSet(networkData.edges)
+                nodes: nodesDataSet,
+                edges: edgesDataSet
             },
             {
                 // CHANGED: Remove hierarchical layout or set enabled: false to rely on physics only.
@@ -63,9 +89,9 @@ function initializeNetwork() {
                     improvedLayout: false // CHANGED: Disables improvedLayout for a raw physics approach
                 },
         
-                // Use physics-based repulsion 
+                // Use physics-based repulsion, unless the server already laid the graph out
                 physics: {
-                    enabled: true,
+                    enabled: !hasFixedLayout(networkData),
                     solver: 'barnesHut',
                     barnesHut: {
                         gravitationalConstant: -60000,
@@ -86,7 +112,9 @@ function initializeNetwork() {
                     maxVelocity: 50,
                 },
                 autoResize: true,
+                groups: NODE_GROUPS,
                 edges: {
+                    color: '#999',
                     smooth: false,
                     arrows: {
                         to: false,
@@ -131,22 +159,17 @@ function initializeNetwork() {
             }
         );
 
-        // Once stabilized add an event to watch for node hovers
-        network.once('stabilized', function () {
-            // Hide spinner after stabilization
-            const spinnerOverlay = document.getElementById('spinner-overlay');
-            if (spinnerOverlay) {
-                spinnerOverlay.style.opacity = '0';
-                setTimeout(() => {
-                    spinnerOverlay.style.display = 'none';
-                }, 500);
-            }
-        });
-
         // Ensure network fills the space initially
         network.fit();                                      
         setupZoomSlider();
         setupNetworkClickHandler();
+
+        // Nodes placed by the server are interactive right away; otherwise wait for physics to settle
+        if (hasFixedLayout(networkData)) {
+            handleStabilized();
+        } else {
+            network.once('stabilized', handleStabilized);
+        }
     
     } catch (error) {
         console.error('Error initializing network:', error);
@@ -156,6 +179,41 @@ function initializeNetwork() {
     }
 }
 
+// True when the server sent x/y positions, so no physics stabilization is needed
+function hasFixedLayout(graphData) {
+    return !!(graphData && graphData.nodes && graphData.nodes.length > 0 && graphData.nodes[0].x !== undefined);
+}
+
+// Runs once the graph is laid out and ready to use
+function handleStabilized() {
+    // Log time-to-first-interactive (from navigation start) the first time the graph is usable
+    if (!window.graphInteractiveLogged && window.performance) {
+        window.graphInteractiveLogged = true;
+        console.info(`Graph interactive after ${Math.round(performance.now())} ms`);
+    }
+
+    // Hide spinner after stabilization
+    const spinnerOverlay = document.getElementById('spinner-overlay');
+    if (spinnerOverlay) {
+        spinnerOverlay.style.opacity = '0';
+        setTimeout(() => {
+            spinnerOverlay.style.display = 'none';
+        }, 500);
+    }
+
+    // Fetch every leaderboard's details in one request so modal opens don't hit the network
+    prefetchLeaderboardDetails();
+}
+
+// Show the spinner while a new selection settles
+function showSpinner() {
+    const spinnerOverlay = document.getElementById('spinner-overlay');
+    if (spinnerOverlay) {
+        spinnerOverlay.style.display = '';
+        spinnerOverlay.style.opacity = '1';
+    }
+}
+
 // Setup when document is ready
 document.addEventListener('DOMContentLoaded', function() {
     const resultsContainer = document.getElementById('results');
@@ -169,17 +227,147 @@ document.addEventListener('DOMContentLoaded', function() {
         initializeNetwork();
     }
 
-    // Setup form submission handler
-    const form = document.getElementById('modelPickerForm');
-    if (form) {
-        form.addEventListener('submit', function() {
-            // Form submission will naturally update URL
-            resultsContainer.classList.remove('hidden');
-        setTimeout(initializeNetwork, 100);                         // Give DOM time to update
-        });
-    }
+    // Back/forward buttons restore the selection captured in the URL
+    window.addEventListener('popstate', function() {
+        syncCheckboxesWithUrl();
+        loadGraph(window.location.search.slice(1));
+    });
 });
 
+/* ========================================================================
+   Selection Changes Without Page Reloads
+   ======================================================================== */
+
+// Fetch the graph for a query string like "tasks=Chat&goals=Speed" and swap it into the network
+function loadGraph(queryString) {
+    // Once a graph is showing, only fetch what changed
+    if (network && window.selectionToken) {
+        return loadGraphDelta(queryString);
+    }
+
+    return fetch(`/api/graph?${queryString}`)
+        .then(res => {
+            checkCatalogVersion(res.headers.get('X-Catalog-Version'));
+            window.selectionToken = res.headers.get('X-Selection-Token');
+            return res.json();
+        })
+        .then(jsonData => {
+            if (jsonData.error) {
+                console.error('Error from server:', jsonData.error);
+                return;
+            }
+            replaceGraph(jsonData);
+        })
+        .catch(error => console.error('Graph fetch error:', error));
+}
+
+// Fetch only the node/edge additions and removals since the current selection
+function loadGraphDelta(queryString) {
+    return fetch(`/api/graph/delta?from=${encodeURIComponent(window.selectionToken)}&${queryString}`)
+        .then(res => res.json())
+        .then(jsonData => {
+            if (jsonData.error) {
+                console.error('Error from server:', jsonData.error);
+                return;
+            }
+            checkCatalogVersion(jsonData.version);
+            window.selectionToken = jsonData.token;
+
+            // The catalog changed under us, so the server sent the whole graph
+            if (jsonData.full) {
+                replaceGraph(jsonData);
+                return;
+            }
+            applyGraphDelta(jsonData);
+        })
+        .catch(error => console.error('Graph delta fetch error:', error));
+}
+
+// Forget prefetched details if the catalog has been updated since the page loaded
+function checkCatalogVersion(version) {
+    if (version && version !== window.dataVersion) {
+        window.dataVersion = version;
+        window.leaderboardDetails.clear();
+    }
+}
+
+// Replace the whole graph in place rather than rebuilding the network
+function replaceGraph(graphData) {
+    window.networkData = { nodes: graphData.nodes, edges: graphData.edges };
+
+    if (!network) {
+        initializeNetwork();
+        return;
+    }
+
+    showSpinner();
+    nodesDataSet.clear();
+    edgesDataSet.clear();
+    nodesDataSet.add(graphData.nodes);
+    edgesDataSet.add(graphData.edges);
+
+    if (hasFixedLayout(graphData)) {
+        network.setOptions({ physics: { enabled: false } });
+        network.fit();
+        handleStabilized();
+    } else {
+        network.once('stabilized', handleStabilized);
+        network.stabilize();
+    }
+}
+
+// Apply a delta so existing nodes keep their positions and only the new region settles
+function applyGraphDelta(delta) {
+    edgesDataSet.remove(delta.edges_removed);
+    nodesDataSet.remove(delta.nodes_removed);
+
+    // Nodes the server's layout moved to make room for the new ones
+    if (delta.nodes_moved && delta.nodes_moved.length > 0) {
+        nodesDataSet.update(delta.nodes_moved);
+    }
+
+    // Without server positions, start each new node at its parent's position so it grows out of the existing graph
+    const parents = {};
+    delta.edges_added.forEach(edge => { parents[edge.to] = edge.from; });
+
+    const placed = {};
+    const added = delta.nodes_added.map(node => {
+        if (node.x !== undefined) {
+            return node;
+        }
+        const parentId = parents[node.id];
+        const position = placed[parentId] ||
+            (nodesDataSet.get(parentId) ? network.getPosition(parentId) : null);
+        if (position) {
+            placed[node.id] = position;
+            return Object.assign({}, node, { x: position.x, y: position.y });
+        }
+        return node;
+    });
+
+    nodesDataSet.add(added);
+    edgesDataSet.add(delta.edges_added);
+
+    if (hasFixedLayout(delta.nodes_added.length > 0 ? { nodes: delta.nodes_added } : window.networkData)) {
+        network.fit();
+        handleStabilized();
+    } else {
+        // Physics picks up the new nodes on its own; prefetch their details once they settle
+        network.once('stabilized', handleStabilized);
+    }
+}
+
+// Check the boxes that match the tasks and goals in the current URL
+function syncCheckboxesWithUrl() {
+    const urlParams = new URLSearchParams(window.location.search);
+    ['tasks', 'goals'].forEach(name => {
+        const selected = urlParams.getAll(name);
+        document.querySelectorAll(`input[name="${name}"]`).forEach(checkbox => {
+            checkbox.checked = selected.includes(checkbox.value);
+        });
+    });
+}
+
 /* ========================================================================
    Slider Configuration and Event Handling
    ======================================================================== */
@@ -242,13 +430,43 @@ function setupNetworkClickHandler() {
         if (params.nodes.length > 0) {
             const nodeId = params.nodes[0];
             
-            if (nodeId.startsWith('leaderboard_')) {
+            // Node IDs are integers, so check the node's group rather than parsing its ID
+            const node = nodesDataSet.get(nodeId);
+            if (node && node.group === 'leaderboard') {
                 handleLeaderboardNodeClick(nodeId);
             }
         }
     });
 }
 
+// Prefetch the details of every leaderboard node in the graph with a single batch request
+function prefetchLeaderboardDetails() {
+    if (!network) return;
+
+    const ids = network.body.data.nodes.getIds({
+        filter: node => node.group === 'leaderboard' && !window.leaderboardDetails.has(String(node.id))
+    });
+    if (ids.length === 0) return;
+
+    fetch('/api/leaderboards/batch', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ ids: ids, version: window.dataVersion })
+    })
+    .then(res => res.json())
+    .then(jsonData => {
+        if (jsonData.error) {
+            console.error('Error from server:', jsonData.error);
+            return;
+        }
+        // Nodes that share a leaderboard point at the same entry in jsonData.details
+        Object.entries(jsonData.leaderboards).forEach(([id, index]) => {
+            window.leaderboardDetails.set(String(id), jsonData.details[index]);
+        });
+    })
+    .catch(error => console.error('Prefetch error:', error));
+}
+
 // Handle clicks on leaderboard nodes
 // In network.js, update handleLeaderboardNodeClick:
 function handleLeaderboardNodeClick(nodeId) {    
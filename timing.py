@@ -0,0 +1,144 @@
+# ========================================================================
+#   Imports
+# ========================================================================
+
+import bisect
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+
+
+# ========================================================================
+#   Histograms
+# ========================================================================
+
+# Bucket upper bounds in seconds, from 50 microseconds (a cache hit) to a few seconds
+DEFAULT_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class Histogram:
+    """
+    Thread-safe histogram with fixed buckets, laid out like a Prometheus histogram.
+
+    Args:
+        buckets (tuple): Sorted bucket upper bounds; values above the last one
+            fall in an implicit +Inf bucket.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+    def cumulative(self):
+        """Returns [(upper bound, observations <= bound), ...], ending with (inf, count)."""
+        with self._lock:
+            counts = list(self._counts)
+        running = 0
+        result = []
+        for bound, count in zip(self.buckets + (float('inf'),), counts):
+            running += count
+            result.append((bound, running))
+        return result
+
+    def quantile(self, q):
+        """The upper bound of the bucket holding the q-th quantile (None if empty)."""
+        cumulative = self.cumulative()
+        total = cumulative[-1][1]
+        if not total:
+            return None
+        for bound, running in cumulative:
+            if running >= q * total:
+                return bound
+        return cumulative[-1][0]
+
+
+class HistogramSet:
+    """A Histogram per label tuple (e.g. (route, stage)), created on first use."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def get(self, *labels):
+        histogram = self._histograms.get(labels)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(labels, Histogram(self.buckets))
+        return histogram
+
+    def items(self):
+        """Returns [(labels, Histogram), ...] sorted by labels."""
+        with self._lock:
+            return sorted(self._histograms.items(), key=lambda item: item[0])
+
+
+# ========================================================================
+#   Request Stage Timers
+# ========================================================================
+
+# The timer for the request being handled in this context, if any
+_current_timer = contextvars.ContextVar('stage_timer', default=None)
+
+
+class StageTimer:
+    """Stage durations (in seconds) for one request, in the order the stages finished."""
+
+    __slots__ = ('started', 'stages')
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages = []
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    def server_timing(self, total):
+        """Formats the stages plus the total as a Server-Timing header value (durations in ms)."""
+        metrics = [f'{name};dur={seconds * 1e3:.2f}' for name, seconds in self.stages]
+        metrics.append(f'total;dur={total * 1e3:.2f}')
+        return ', '.join(metrics)
+
+
+def start_timer():
+    """Starts timing a request; stage() calls in this context record into the returned timer."""
+    timer = StageTimer()
+    _current_timer.set(timer)
+    return timer
+
+
+def stop_timer():
+    """Detaches the current timer so later work in this context (e.g. a reused thread) isn't recorded."""
+    timer = _current_timer.get()
+    _current_timer.set(None)
+    return timer
+
+
+@contextmanager
+def stage(name):
+    """
+    Times the enclosed block as a named stage of the current request.
+
+    Outside a timed request (startup, background threads) this does nothing,
+    so library code can mark its stages unconditionally.
+    """
+    timer = _current_timer.get()
+    if timer is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timer.stages.append((name, time.perf_counter() - start))